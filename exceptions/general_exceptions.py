@@ -6,3 +6,27 @@ This module contains the exceptions that are commonly used.
 class SiteNotSupported(Exception):
     def __init__(self, hostname):
         self.message = f"SiteNotSupported: {hostname} Repository host not supported."
+
+
+class RecordedExchangeNotFound(Exception):
+    def __init__(self, request_key):
+        self.message = f"RecordedExchangeNotFound: {request_key} was not found in the recorded HTTP traffic."
+        super().__init__(self.message)
+
+
+class AuditError(Exception):
+    def __init__(self, message):
+        self.message = f"AuditError: {message}"
+        super().__init__(self.message)
+
+
+class DeadlineExceeded(Exception):
+    def __init__(self, deadline):
+        self.message = f"DeadlineExceeded: The command did not complete within the deadline of {deadline} seconds."
+        super().__init__(self.message)
+
+
+class EstimateError(Exception):
+    def __init__(self, message):
+        self.message = f"EstimateError: {message}"
+        super().__init__(self.message)
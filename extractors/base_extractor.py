@@ -1,16 +1,55 @@
 """
 This module contains the BaseExtractor Abstract class which all other extractors are inherited from.
 """
+import logging
+
 from abc import ABC, abstractmethod
+from collections import namedtuple
+from urllib.parse import urlparse
+from utilities.config import Credentials, get_credentials
+from utilities.label_counts import record_label_counts
+from utilities.logging_config import LazyJson
+from utilities.run_control import operation_tracker, run_async
+
+logger = logging.getLogger(__name__)
+
+RateLimit = namedtuple('RateLimit', ['limit', 'remaining', 'used', 'reset_time'])
 
 
 class BaseExtractor(ABC):
+    # The default API base url of the backend, it is overridden by the API base url configured for the host.
+    default_api_base_url = None
+    # The max number of labels per page allowed by the backend API for the retrieval of the list of labels.
+    per_page = 100
+    # The number of seconds after which the rate limit of the backend API is replenished, None if it is not known.
+    rate_limit_window = None
+    # Whether the retrieved labels are coalesced and cached by label_requests, such as with --cache-ttl.
+    caches_label_requests = False
+    # The prefix of the environment variables of the credentials of the default host of the backend such as GITHUB,
+    # it is overridden by the credentials configured for the host.
+    default_credentials_prefix = None
 
-    def __init__(self, link):
+    def __init__(self, link, api_base_url=None, credentials: Credentials = None):
         self.link = link
+        self.api_base_url = api_base_url or self.default_api_base_url
+        self.credentials = credentials or get_credentials(self.default_credentials_prefix)
         self.repo_owner = None
         self.repo_name = None
 
+    @staticmethod
+    def parse_repo_link(link):
+        """
+        Returns the repository owner and repository name of repository links in the format
+        https://{hostname}/{repo_owner}/{repo_name}
+        :param link: The repository link
+        :return: Returns the repository owner and repository name, None if the link is not a repository link.
+        """
+
+        parsed_url_path = urlparse(link).path.split('/')
+        if len(parsed_url_path) >= 3:
+            return parsed_url_path[1], parsed_url_path[2]
+        return None, None
+
     @abstractmethod
     def get_rate_limit(self):
         raise NotImplementedError
@@ -19,6 +58,48 @@ class BaseExtractor(ABC):
     def request_labels(self):
         raise NotImplementedError
 
-    @abstractmethod
-    def execute(self):
+    async def get_rate_limit_resources(self):
+        """
+        Returns Service name and the rate limit of each resource of the backend API.
+        Note: By default, the only resource is the rate limit returned by get_rate_limit.
+        :return: Returns the service name and a dictionary of the resource names to their RateLimit,
+        the dictionary is empty if the service does not enforce rate limits.
+        """
+        service_name, total_rate_limit, rate_limit_remaining, rate_limit_used, rate_limit_reset_time = \
+            await self.get_rate_limit()
+        if total_rate_limit is None:
+            return service_name, dict()
+        return service_name, {'core': RateLimit(total_rate_limit, rate_limit_remaining, rate_limit_used,
+                                                rate_limit_reset_time)}
+
+    async def request_num_of_labels(self):
+        """
+        Returns the number of labels of the repository using as few API calls as possible.
+        :return: Returns the number of labels of the repository.
+        """
+        return len(await self.request_labels())
+
+    async def request_org_repo_links(self, org_name):
+        """
+        Returns the links to the repositories of the organisation, excluding archived repositories.
+        :param org_name: The name of the organisation, group or user
+        :return: Returns the list of links to the repositories of the organisation, None if the organisation does not
+        exist.
+        """
         raise NotImplementedError
+
+    def execute(self):
+        """
+        This is the main function which will be executed to run the extractor.
+        It returns a dictionary of labels with customised properties compatible with this command line interface.
+        :return: It returns a dictionary of labels with customised properties compatible
+        with this command line interface
+        """
+
+        custom_labels_dict_json = run_async(
+            operation_tracker.track(f'Retrieve the labels of {self.link}', self.request_labels))
+        record_label_counts({self.link: len(custom_labels_dict_json)})
+        logger.debug('%d labels extracted from %s: %s', len(custom_labels_dict_json), self.link,
+                     LazyJson(custom_labels_dict_json))
+
+        return custom_labels_dict_json
@@ -0,0 +1,112 @@
+"""
+This module contains the extractor for Gitea.
+Gitea: https://gitea.com/
+"""
+
+import asyncio
+import logging
+
+from extractors.base_extractor import BaseExtractor
+from utilities.config import Credentials
+from utilities.http_traffic import client_session
+from utilities.label_normalization import normalize_label
+from utilities.logging_config import LazyJson
+
+logger = logging.getLogger(__name__)
+
+
+class GiteaExtractor(BaseExtractor):
+    default_api_base_url = 'https://gitea.com/api/v1'
+    # Max number of labels per page allowed by Gitea API by default (MAX_RESPONSE_ITEMS) is 50
+    # https://docs.gitea.io/en-us/config-cheat-sheet/#api-api
+    per_page = 50
+    default_credentials_prefix = 'GITEA'
+
+    def __init__(self, link, api_base_url=None, credentials: Credentials = None):
+        super().__init__(link, api_base_url, credentials)
+        self.repo_owner, self.repo_name = self.parse_repo_link(link)
+        self.labels_api_link = f'{self.api_base_url}/repos/{self.repo_owner}/{self.repo_name}/labels'
+        personal_access_token = self.credentials.personal_access_token
+        self.api_headers = {'Authorization': f'token {personal_access_token}'} if personal_access_token else {}
+        # Gitea API updates and deletes labels by their id, hence the ids of the extracted labels are kept.
+        self.label_ids = dict()
+
+    def gen_custom_labels_dict(self, list_of_label_dict):
+        custom_labels_dict = dict()
+        for current_label_dict in list_of_label_dict:
+            current_label_name = current_label_dict['name'].lower()
+            self.label_ids[current_label_name] = current_label_dict['id']
+            # Gitea API colors may be prefixed with # unlike the format compatible with this command line interface
+            custom_labels_dict[current_label_name] = normalize_label(current_label_dict)
+        return custom_labels_dict
+
+    async def get_rate_limit(self):
+        """
+        Returns Service name, the total rate limit, remaining rate limit, rate limit used and time which rate limit will reset.
+        Note: Gitea API does not enforce rate limits, hence the values are None.
+        :return: Returns the total rate limit, remaining rate limit, rate limit used and time
+        which rate limit will reset.
+        """
+        return "Gitea API", None, None, None, None
+
+    async def request_num_of_labels(self):
+        """
+        Returns the number of labels of the repository in a single API call based on the X-Total-Count header.
+        :return: Returns the number of labels of the repository.
+        """
+        async with client_session(headers=self.api_headers) as session:
+            async with session.get(self.labels_api_link, params={'limit': 1, 'page': 1}) as response:
+                response.raise_for_status()
+                return int(response.headers.get('X-Total-Count', 0))
+
+    async def get_labels_dict(self, session, request_params):
+        """
+        Returns a dictionary of labels with customised properties and the total number of pages based on
+        the list of labels retrieved from the Gitea API
+        :param session: The session object
+        :param request_params: The request_params which should contain the limit and page params
+        :return: Returns a dictionary of labels with customised properties and the total number of pages.
+        """
+        async with session.get(self.labels_api_link, params=request_params) as response:
+            response.raise_for_status()
+            logger.debug('get_labels method page request information %s', response.request_info)
+            total_count = int(response.headers.get('X-Total-Count', 0))
+            current_labels = await response.json()
+            logger.debug('labels list json from Gitea API: %s', LazyJson(current_labels))
+            num_of_pages = max(1, -(-total_count // self.per_page))
+            return self.gen_custom_labels_dict(current_labels), num_of_pages
+
+    async def request_labels(self):
+        async with client_session(headers=self.api_headers) as session:
+            params = {'limit': self.per_page, 'page': 1}
+            custom_labels_dict_json, num_of_pages = await self.get_labels_dict(session, params)
+
+            # Optimisation: The remaining pages are requested concurrently as the total number of pages is known.
+            tasks = [asyncio.ensure_future(self.get_labels_dict(session, {**params, 'page': current_page_num}))
+                     for current_page_num in range(2, num_of_pages + 1)]
+            for current_dict, _ in await asyncio.gather(*tasks):
+                custom_labels_dict_json.update(current_dict)
+
+            return custom_labels_dict_json
+
+    async def request_org_repo_links(self, org_name):
+        async with client_session(headers=self.api_headers) as session:
+            repo_links = []
+            # The repositories of a user account are listed if the organisation does not exist.
+            for repos_api_link in [f'{self.api_base_url}/orgs/{org_name}/repos',
+                                   f'{self.api_base_url}/users/{org_name}/repos']:
+                current_page_num = 1
+                while True:
+                    params = {'limit': self.per_page, 'page': current_page_num}
+                    async with session.get(repos_api_link, params=params) as response:
+                        if response.status == 404 and current_page_num == 1:
+                            break
+                        response.raise_for_status()
+                        current_repos = await response.json()
+                    repo_links.extend(current_repo['html_url'] for current_repo in current_repos
+                                      if not current_repo.get('archived'))
+                    if len(current_repos) < self.per_page:
+                        return repo_links
+                    current_page_num += 1
+            # Neither the organisation nor the user exists.
+            return None
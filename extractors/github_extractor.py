@@ -3,58 +3,50 @@ This module contains the extractor for GitHub.
 GitHub: https://github.com/
 """
 
-import json
-import os
-
-import aiohttp
 import asyncio
 import logging
 
 from aiohttp import BasicAuth
 from bs4 import BeautifulSoup
 from datetime import datetime
-from extractors.base_extractor import BaseExtractor
-from utilities.config import GITHUB_USERNAME, GITHUB_PERSONAL_ACCESS_TOKEN
+from extractors.base_extractor import BaseExtractor, RateLimit
+from utilities.config import Credentials
+from utilities.http_traffic import client_session, exchange_key, shared_client_session
+from utilities.label_normalization import normalize_label
+from utilities.logging_config import LazyJson
+from utilities.request_coalescing import label_requests
 from urllib.parse import urlparse, parse_qs
 
 logger = logging.getLogger(__name__)
 
 
 class GitHubExtractor(BaseExtractor):
-
-    def __init__(self, link):
-        super().__init__(link)
-        self.main_api_link = 'https://api.github.com'
+    default_api_base_url = 'https://api.github.com'
+    # Max number of labels per page allowed by GitHub API for retrieval of the list of labels in repository is 100
+    # https://docs.github.com/en/rest/reference/issues#list-labels-for-a-repository
+    per_page = 100
+    # The rate limit of GitHub API Resources is replenished every hour
+    # https://docs.github.com/en/rest/overview/resources-in-the-rest-api#rate-limiting
+    rate_limit_window = 3600
+    caches_label_requests = True
+    default_credentials_prefix = 'GITHUB'
+
+    def __init__(self, link, api_base_url=None, credentials: Credentials = None):
+        super().__init__(link, api_base_url, credentials)
+        self.main_api_link = self.api_base_url
         self.accept_header = 'application/vnd.github.v3+json'
-        # Max number of labels per page allowed by GitHub API for retrieval of the list of labels in repository is 100
-        # https://docs.github.com/en/rest/reference/issues#list-labels-for-a-repository
-        self.per_page = 100
         self.total_num_pages_labels = None
-        self.repo_owner, self.repo_name = self.parse_github_link(link)
+        self.repo_owner, self.repo_name = self.parse_repo_link(link)
         self.labels_api_link = f'{self.main_api_link}/repos/{self.repo_owner}/{self.repo_name}/labels'
-        self.authentication = BasicAuth(GITHUB_USERNAME, password=GITHUB_PERSONAL_ACCESS_TOKEN)
-
-    @staticmethod
-    def parse_github_link(link):
-        parsed_url_path = urlparse(link).path.split('/')
-        if len(parsed_url_path) >= 3:
-            repo_owner = parsed_url_path[1]
-            repo_name = parsed_url_path[2]
-            return repo_owner, repo_name
-        return None, None
+        # The requests are not authenticated if the credentials of the host are not configured.
+        self.authentication = BasicAuth(self.credentials.username, password=self.credentials.personal_access_token) \
+            if self.credentials.username else None
 
     @staticmethod
     def gen_custom_labels_dict(list_of_label_dict):
         custom_labels_dict = dict()
         for current_label_dict in list_of_label_dict:
-            current_label_name = current_label_dict['name'].lower()
-            custom_labels_dict[current_label_name] = {
-                **current_label_dict
-            }
-            del custom_labels_dict[current_label_name]['id']
-            del custom_labels_dict[current_label_name]['node_id']
-            del custom_labels_dict[current_label_name]['url']
-            del custom_labels_dict[current_label_name]['default']
+            custom_labels_dict[current_label_dict['name'].lower()] = normalize_label(current_label_dict)
         return custom_labels_dict
 
     async def get_rate_limit(self):
@@ -66,7 +58,7 @@ class GitHubExtractor(BaseExtractor):
         which rate limit will reset.
         """
         api_headers = {'Accept': self.accept_header}
-        async with aiohttp.ClientSession() as session:
+        async with client_session() as session:
             async with session.get(f'{self.main_api_link}/rate_limit', params=api_headers,
                                    auth=self.authentication) as response:
                 result = await response.json()
@@ -74,6 +66,40 @@ class GitHubExtractor(BaseExtractor):
                 return "GitHub API", result['limit'], result['remaining'], result['used'], \
                        datetime.fromtimestamp(result['reset'])
 
+    async def get_rate_limit_resources(self):
+        """
+        Returns Service name and the rate limit of each GitHub API Resources such as core, search and graphql.
+        Note: Retrieving the rate limit does not count against the GitHub API rate limit.
+        :return: Returns the service name and a dictionary of the resource names to their RateLimit.
+        """
+        api_headers = {'Accept': self.accept_header}
+        async with client_session(headers=api_headers, auth=self.authentication) as session:
+            async with session.get(f'{self.main_api_link}/rate_limit') as response:
+                response.raise_for_status()
+                result = await response.json()
+                return "GitHub API", {
+                    resource_name: RateLimit(resource['limit'], resource['remaining'],
+                                             resource.get('used', resource['limit'] - resource['remaining']),
+                                             datetime.fromtimestamp(resource['reset']))
+                    for resource_name, resource in result['resources'].items()
+                }
+
+    async def request_num_of_labels(self):
+        """
+        Returns the number of labels of the repository in a single API call.
+        Optimisation: A page of a single label is requested, hence the page number of the last page in the
+        Link header is the number of labels.
+        :return: Returns the number of labels of the repository.
+        """
+        api_headers = {'Accept': self.accept_header}
+        async with client_session(headers=api_headers, auth=self.authentication) as session:
+            async with session.get(self.labels_api_link, params={'per_page': 1, 'page': 1}) as response:
+                response.raise_for_status()
+                if response.links.get('last'):
+                    query_string = urlparse(str(response.links.get('last').get('url'))).query
+                    return int(parse_qs(query_string)['page'][0])
+                return len(await response.json())
+
     async def get_num_of_pages(self, session):
         """
         TODO: Possibly removed in the future including beautifulsoup dependencies as the function is currently not used.
@@ -89,83 +115,100 @@ class GitHubExtractor(BaseExtractor):
             soup = BeautifulSoup(html, 'html.parser')
             num_of_labels = int(soup.select('div.labels-list span.js-labels-count', limit=1)[0].contents[0])
             num_of_pages = (num_of_labels // self.per_page) + (1 if num_of_labels % self.per_page != 0 else 0)
-            logger.debug(f'{self.link} has {num_of_pages} pages.')
+            logger.debug('%s has %d pages.', self.link, num_of_pages)
             return num_of_pages
 
-    async def get_labels_dict(self, session, request_params):
+    async def request_labels_page(self, request_params):
         """
-        Returns a dictionary of labels with customised properties based on the list of labels retrieved from the
-        GitHub API
-        :param session: The session object
+        Returns the list of labels of the page retrieved from the GitHub API and the total number of pages
+        Note: The page is requested on the shared session instead of the session of a caller as the request may be
+        shared by coalesced callers, hence the shared request is not closed when the caller which started it
+        is cancelled. The connections of the shared session are reused across the pages.
         :param request_params: The request_params which should contain the per_page and page params
-        :return: Returns a dictionary of labels with customised properties.
+        :return: Returns the list of labels of the page and the total number of pages if it is the first page
+        else None.
         """
-        async with session.get(self.labels_api_link, params=request_params) as response:
+        api_headers = {'Accept': self.accept_header}
+        async with shared_client_session().get(self.labels_api_link, params=request_params, headers=api_headers,
+                                               auth=self.authentication) as response:
+            response.raise_for_status()
+            num_of_pages = None
             # Optimisation: If it is the first page, besides retrieving the json response,
             # the total number of pages is also retrieved in a single API call. This is to reduce unnecessary API calls.
             if request_params['page'] == 1:
                 query_string = urlparse(str(response.links.get('last').get('url'))).query if \
                     response.links.get('last') else None
-                self.total_num_pages_labels = \
-                    int(parse_qs(query_string)['page'][0]) if query_string else 1
-            logger.debug(f'get_labels method page request information {response.request_info}')
+                num_of_pages = int(parse_qs(query_string)['page'][0]) if query_string else 1
+            logger.debug('get_labels method page request information %s', response.request_info)
             current_labels = await response.json()
-            logger.debug(f'labels list json from GitHub API: {json.dumps(current_labels)}')
-            return self.gen_custom_labels_dict(current_labels)
+            logger.debug('labels list json from GitHub API: %s', LazyJson(current_labels))
+            return current_labels, num_of_pages
 
-    async def request_labels(self):
-        api_headers = {'Accept': self.accept_header}
-        async with aiohttp.ClientSession(headers=api_headers, auth=self.authentication) as session:
-            tasks = []
-            custom_labels_dict_json = dict()
-
-            is_first = True
-            num_of_pages = 1
-            current_page_num = 1
-            while current_page_num <= num_of_pages:
-                params = {'per_page': self.per_page, 'page': current_page_num}
-
-                if is_first:
-                    response = await self.get_labels_dict(session, params)
-                    custom_labels_dict_json.update(response)
-                    logger.debug(custom_labels_dict_json)
-                    num_of_pages = self.total_num_pages_labels
-                    is_first = False
-                else:
-                    tasks.append(asyncio.ensure_future(self.get_labels_dict(session, params)))
-
-                current_page_num += 1
-
-            if tasks:
-                custom_json_list_labels = await asyncio.gather(*tasks)
-                logger.debug(custom_json_list_labels)
-
-                # To convert the list to a dictionary (custom format json compatible with
-                # this command line interface)
-                for current_dict in custom_json_list_labels:
-                    logger.debug(current_dict)
-                    custom_labels_dict_json.update(current_dict)
-
-            logger.debug(custom_labels_dict_json)
-            return custom_labels_dict_json
-
-    def execute(self):
+    async def get_labels_dict(self, request_params):
         """
-        This is the main function which will be executed to run the GitHub extractor.
-        It returns a dictionary of labels with customised properties compatible with this command line interface.
-        :return: It returns a dictionary of labels with customised properties compatible
-        with this command line interface
+        Returns a dictionary of labels with customised properties based on the list of labels retrieved from the
+        GitHub API
+        :param request_params: The request_params which should contain the per_page and page params
+        :return: Returns a dictionary of labels with customised properties.
         """
+        # Optimisation: Identical page requests in flight at the same time, such as a repository which is both the
+        # source and the destination, are merged into a single API call. This is to reduce unnecessary API calls.
+        current_labels, num_of_pages = await label_requests.request(
+            exchange_key('GET', self.labels_api_link, request_params),
+            lambda: self.request_labels_page(request_params))
+        if request_params['page'] == 1:
+            self.total_num_pages_labels = num_of_pages
+        return self.gen_custom_labels_dict(current_labels)
+
+    async def request_org_repo_links(self, org_name):
+        api_headers = {'Accept': self.accept_header}
+        async with client_session(headers=api_headers, auth=self.authentication) as session:
+            repo_links = []
+            # The repositories of a user account are listed if the organisation does not exist.
+            for repos_api_link in [f'{self.main_api_link}/orgs/{org_name}/repos',
+                                   f'{self.main_api_link}/users/{org_name}/repos']:
+                current_page_num = 1
+                while True:
+                    params = {'per_page': self.per_page, 'page': current_page_num}
+                    async with session.get(repos_api_link, params=params) as response:
+                        if response.status == 404 and current_page_num == 1:
+                            break
+                        response.raise_for_status()
+                        current_repos = await response.json()
+                    repo_links.extend(current_repo['html_url'] for current_repo in current_repos
+                                      if not current_repo.get('archived'))
+                    if len(current_repos) < self.per_page:
+                        return repo_links
+                    current_page_num += 1
+            # Neither the organisation nor the user exists.
+            return None
 
-        # Workaround for known issue involving event loop for Windows environment:
-        # Resources:
-        # https://github.com/aio-libs/aiohttp/issues/4536#issuecomment-698441077
-        # https://bugs.python.org/issue39232 (Known issue in Python)
-        if os.name == "nt":
-            asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
-        custom_labels_dict_json = asyncio.run(self.request_labels())
-        logger.debug(custom_labels_dict_json)
-        logger.debug(json.dumps(custom_labels_dict_json))
-        logger.debug(len(custom_labels_dict_json.keys()))
+    async def request_labels(self):
+        tasks = []
+        custom_labels_dict_json = dict()
+
+        is_first = True
+        num_of_pages = 1
+        current_page_num = 1
+        while current_page_num <= num_of_pages:
+            params = {'per_page': self.per_page, 'page': current_page_num}
+
+            if is_first:
+                response = await self.get_labels_dict(params)
+                custom_labels_dict_json.update(response)
+                num_of_pages = self.total_num_pages_labels
+                is_first = False
+            else:
+                tasks.append(asyncio.ensure_future(self.get_labels_dict(params)))
+
+            current_page_num += 1
+
+        if tasks:
+            custom_json_list_labels = await asyncio.gather(*tasks)
+
+            # To convert the list to a dictionary (custom format json compatible with
+            # this command line interface)
+            for current_dict in custom_json_list_labels:
+                custom_labels_dict_json.update(current_dict)
 
         return custom_labels_dict_json
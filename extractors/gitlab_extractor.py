@@ -0,0 +1,145 @@
+"""
+This module contains the extractor for GitLab.
+GitLab: https://gitlab.com/
+"""
+
+import asyncio
+import logging
+
+from datetime import datetime
+from extractors.base_extractor import BaseExtractor
+from utilities.config import Credentials
+from utilities.http_traffic import client_session
+from utilities.label_normalization import normalize_label
+from utilities.logging_config import LazyJson
+from urllib.parse import urlparse, quote
+
+logger = logging.getLogger(__name__)
+
+
+class GitLabExtractor(BaseExtractor):
+    default_api_base_url = 'https://gitlab.com/api/v4'
+    # Max number of labels per page allowed by GitLab API for retrieval of the list of labels in project is 100
+    # https://docs.gitlab.com/ee/api/index.html#offset-based-pagination
+    per_page = 100
+    # The rate limits of GitLab.com are replenished every minute
+    # https://docs.gitlab.com/ee/user/gitlab_com/index.html#gitlabcom-specific-rate-limits
+    rate_limit_window = 60
+    default_credentials_prefix = 'GITLAB'
+
+    def __init__(self, link, api_base_url=None, credentials: Credentials = None):
+        super().__init__(link, api_base_url, credentials)
+        self.repo_owner, self.repo_name = self.parse_gitlab_link(link)
+        # GitLab API identifies a project by its url encoded path including all of its namespaces
+        self.project_id = quote(f'{self.repo_owner}/{self.repo_name}', safe='')
+        self.labels_api_link = f'{self.api_base_url}/projects/{self.project_id}/labels'
+        personal_access_token = self.credentials.personal_access_token
+        self.api_headers = {'PRIVATE-TOKEN': personal_access_token} if personal_access_token else {}
+
+    @staticmethod
+    def parse_gitlab_link(link):
+        """
+        Returns the namespace and project name of the GitLab project link. The namespace includes any subgroups
+        such as https://gitlab.com/group/subgroup/project which returns group/subgroup and project.
+        :param link: The GitLab project link
+        :return: Returns the namespace and project name
+        """
+
+        parsed_url_path = [path for path in urlparse(link).path.split('/') if path]
+        # Project pages such as https://gitlab.com/group/project/-/labels are separated by a -
+        if '-' in parsed_url_path:
+            parsed_url_path = parsed_url_path[:parsed_url_path.index('-')]
+        if len(parsed_url_path) >= 2:
+            return '/'.join(parsed_url_path[:-1]), parsed_url_path[-1]
+        return None, None
+
+    @staticmethod
+    def gen_custom_labels_dict(list_of_label_dict):
+        custom_labels_dict = dict()
+        for current_label_dict in list_of_label_dict:
+            # GitLab API colors are prefixed with # unlike the format compatible with this command line interface
+            custom_labels_dict[current_label_dict['name'].lower()] = normalize_label(current_label_dict)
+        return custom_labels_dict
+
+    async def get_rate_limit(self):
+        """
+        Returns Service name, the total rate limit, remaining rate limit, rate limit used and time which rate limit will reset.
+        Note: GitLab API does not have a rate limit endpoint, hence the rate limit is retrieved from the RateLimit
+        headers of a lightweight request. The values are None if the GitLab instance does not enforce rate limits.
+        :return: Returns the total rate limit, remaining rate limit, rate limit used and time
+        which rate limit will reset.
+        """
+        async with client_session(headers=self.api_headers) as session:
+            async with session.get(f'{self.api_base_url}/version') as response:
+                headers = response.headers
+                if 'RateLimit-Limit' not in headers:
+                    return "GitLab API", None, None, None, None
+                return "GitLab API", int(headers['RateLimit-Limit']), int(headers['RateLimit-Remaining']), \
+                    int(headers['RateLimit-Observed']), datetime.fromtimestamp(int(headers['RateLimit-Reset']))
+
+    async def request_num_of_labels(self):
+        """
+        Returns the number of labels of the project in a single API call based on the X-Total header.
+        Note: GitLab API omits the X-Total header for more than 10,000 labels, hence the labels are retrieved instead.
+        :return: Returns the number of labels of the project.
+        """
+        async with client_session(headers=self.api_headers) as session:
+            params = {'per_page': 1, 'page': 1, 'include_ancestor_groups': 'false'}
+            async with session.get(self.labels_api_link, params=params) as response:
+                response.raise_for_status()
+                total = response.headers.get('X-Total')
+        return int(total) if total else len(await self.request_labels())
+
+    async def get_labels_dict(self, session, request_params):
+        """
+        Returns a dictionary of labels with customised properties, the total number of pages and the next page
+        based on the list of labels retrieved from the GitLab API
+        :param session: The session object
+        :param request_params: The request_params which should contain the per_page and page params
+        :return: Returns a dictionary of labels with customised properties, the total number of pages
+        and the next page. The total number of pages is None if GitLab API omits it and the next page is None
+        if it is the last page.
+        """
+        async with session.get(self.labels_api_link, params=request_params) as response:
+            response.raise_for_status()
+            logger.debug('get_labels method page request information %s', response.request_info)
+            total_pages = response.headers.get('X-Total-Pages')
+            next_page = response.headers.get('X-Next-Page')
+            current_labels = await response.json()
+            logger.debug('labels list json from GitLab API: %s', LazyJson(current_labels))
+            return self.gen_custom_labels_dict(current_labels), int(total_pages) if total_pages else None, \
+                int(next_page) if next_page else None
+
+    async def request_labels(self):
+        async with client_session(headers=self.api_headers) as session:
+            params = {'per_page': self.per_page, 'page': 1, 'include_ancestor_groups': 'false'}
+            custom_labels_dict_json, num_of_pages, next_page = await self.get_labels_dict(session, params)
+
+            if num_of_pages:
+                # Optimisation: The remaining pages are requested concurrently as the total number of pages is known.
+                tasks = [asyncio.ensure_future(self.get_labels_dict(session, {**params, 'page': current_page_num}))
+                         for current_page_num in range(2, num_of_pages + 1)]
+                for current_dict, _, _ in await asyncio.gather(*tasks):
+                    custom_labels_dict_json.update(current_dict)
+            else:
+                # GitLab API omits the X-Total-Pages header for more than 10,000 labels,
+                # hence the pages are requested one after another until there is no next page.
+                while next_page:
+                    current_dict, _, next_page = await self.get_labels_dict(session, {**params, 'page': next_page})
+                    custom_labels_dict_json.update(current_dict)
+
+            return custom_labels_dict_json
+
+    async def request_org_repo_links(self, org_name):
+        group_projects_api_link = f"{self.api_base_url}/groups/{quote(org_name, safe='')}/projects"
+        async with client_session(headers=self.api_headers) as session:
+            repo_links = []
+            next_page = 1
+            while next_page:
+                params = {'per_page': self.per_page, 'page': next_page, 'include_subgroups': 'true',
+                          'archived': 'false'}
+                async with session.get(group_projects_api_link, params=params) as response:
+                    response.raise_for_status()
+                    next_page = int(response.headers['X-Next-Page']) if response.headers.get('X-Next-Page') else None
+                    repo_links.extend(current_project['web_url'] for current_project in await response.json())
+            return repo_links
@@ -1,23 +1,143 @@
 """
 This module contains the BaseImporter Abstract class which all other importers are inherited from.
 """
-from abc import ABC, abstractmethod
+import asyncio
+import logging
 
+from abc import ABC, abstractmethod
+from functools import partial
+from utilities.config import Credentials
 from utilities.constants import ImportModes
+from utilities.http_traffic import exchange_key
+from utilities.label_counts import forget_label_counts, record_label_counts
+from utilities.label_diff import diff_labels
+from utilities.label_normalization import normalize_labels
+from utilities.request_coalescing import label_requests
+from utilities.run_control import operation_tracker, run_async
+
+logger = logging.getLogger(__name__)
 
 
 class BaseImporter(ABC):
+    # The extractor of the same backend which is used to retrieve the existing labels of the repository.
+    extractor_class = None
+    # The max number of concurrent label write requests, None if the backend does not limit concurrent writes.
+    max_concurrent_writes = None
 
-    def __init__(self, link, loaded_json_data):
+    def __init__(self, link, loaded_json_data, api_base_url=None, credentials: Credentials = None):
         self.link = link
-        self.json_data = loaded_json_data
+        self.json_data = normalize_labels(loaded_json_data)
+        self.api_base_url = api_base_url or self.extractor_class.default_api_base_url
+        self.credentials = credentials
         self.repo_owner = None
         self.repo_name = None
+        self.labels_api_link = None
+        self.existing_extractor = None
+        self.existing_labels_json = None
 
     @abstractmethod
-    def import_labels(self):
+    def create_session(self):
         raise NotImplementedError
 
     @abstractmethod
-    def execute(self, mode: ImportModes):
+    async def create_label(self, session, properties):
+        raise NotImplementedError
+
+    @abstractmethod
+    async def update_label(self, session, label_name, new_properties):
         raise NotImplementedError
+
+    @abstractmethod
+    async def delete_label(self, session, label_name):
+        raise NotImplementedError
+
+    async def gather_writes(self, write_coroutines):
+        """
+        Runs the label write requests concurrently, bounded by the max number of concurrent writes of the backend.
+        :param write_coroutines: The list of label write request coroutines
+        :return: Returns the list of results of the label write requests.
+        """
+
+        if self.max_concurrent_writes:
+            semaphore = asyncio.Semaphore(self.max_concurrent_writes)
+
+            async def bounded_write(write_coroutine):
+                async with semaphore:
+                    return await write_coroutine
+
+            write_coroutines = [bounded_write(write_coroutine) for write_coroutine in write_coroutines]
+
+        try:
+            # The remaining label write requests are completed even if a label write request fails
+            # so that the partial report is accurate.
+            results = await asyncio.gather(*write_coroutines, return_exceptions=True)
+        finally:
+            # The cached labels of the repository are outdated once the labels have been modified.
+            label_requests.invalidate(exchange_key('GET', self.labels_api_link))
+
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+        return results
+
+    async def import_labels(self):
+        # Optimisation: If the label and its canonical properties in the repository are identical to the json file,
+        # there will not be any API calls. This is to reduce unnecessary API calls.
+        label_diff = diff_labels(self.json_data, self.existing_labels_json)
+        async with self.create_session() as session:
+            tasks = []
+            for current_label_name in label_diff.mismatched:
+                tasks.append(operation_tracker.track(
+                    f'Update label {current_label_name} in {self.link}',
+                    partial(self.update_label, session, self.existing_labels_json[current_label_name]['name'],
+                            self.json_data[current_label_name])))
+            for current_label_name in label_diff.missing:
+                tasks.append(operation_tracker.track(
+                    f'Create label {current_label_name} in {self.link}',
+                    partial(self.create_label, session, self.json_data[current_label_name])))
+            for current_label_name in label_diff.extra:
+                tasks.append(operation_tracker.track(
+                    f'Delete label {current_label_name} in {self.link}',
+                    partial(self.delete_label, session, self.existing_labels_json[current_label_name]['name'])))
+
+            if tasks:
+                await self.gather_writes(tasks)
+
+        logger.info(f'{len(label_diff.unchanged)} labels skipped as they are unchanged and {len(tasks)} labels '
+                    f'written to {self.link} ({len(label_diff.missing)} created, {len(label_diff.mismatched)} '
+                    f'updated and {len(label_diff.extra)} deleted).')
+
+    async def delete_all_labels(self):
+        async with self.create_session() as session:
+            tasks = []
+            for current_label_name in self.json_data.keys():
+                tasks.append(operation_tracker.track(
+                    f'Delete label {current_label_name} in {self.link}',
+                    partial(self.delete_label, session, self.existing_labels_json[current_label_name]['name'])))
+
+            if tasks:
+                await self.gather_writes(tasks)
+
+    def execute(self, mode: ImportModes):
+        """
+        This is the main function which will be executed to run the importer.
+        :return: It returns True if import is successful and false if it is not successful.
+        """
+
+        self.existing_extractor = self.extractor_class(self.link, self.api_base_url, self.credentials)
+        self.existing_labels_json = self.existing_extractor.execute()
+
+        try:
+            if mode == ImportModes.IMPORT_LABELS:
+                run_async(self.import_labels())
+                # The repository has exactly the labels of the json file once they are imported.
+                record_label_counts({self.link: len(self.json_data)})
+            elif mode == ImportModes.DEL_ALL_LABELS:
+                run_async(self.delete_all_labels())
+                record_label_counts({self.link: 0})
+            else:
+                logger.error('Invalid Importer modes.')
+        except BaseException:
+            # The labels may have been partially written, hence the cached number of labels is no longer known.
+            forget_label_counts([self.link])
+            raise
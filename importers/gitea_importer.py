@@ -0,0 +1,71 @@
+"""
+This module contains the importer for Gitea.
+Gitea: https://gitea.com/
+"""
+
+import logging
+
+from extractors.gitea_extractor import GiteaExtractor
+from importers.base_importer import BaseImporter
+from utilities.config import Credentials
+from utilities.http_traffic import client_session
+from utilities.label_normalization import DEFAULT_LABEL_COLOR
+from utilities.logging_config import LazyJson
+
+logger = logging.getLogger(__name__)
+
+
+class GiteaImporter(BaseImporter):
+    extractor_class = GiteaExtractor
+    # Self-hosted Gitea instances are commonly run on small servers, hence the concurrent label writes are limited.
+    max_concurrent_writes = 10
+
+    def __init__(self, link, loaded_json_data, api_base_url=None, credentials: Credentials = None):
+        super().__init__(link, loaded_json_data, api_base_url, credentials)
+        extractor = GiteaExtractor(link, self.api_base_url, credentials)
+        self.repo_owner, self.repo_name = extractor.repo_owner, extractor.repo_name
+        self.labels_api_link = extractor.labels_api_link
+        self.api_headers = extractor.api_headers
+
+    @staticmethod
+    def gen_gitea_properties(properties):
+        gen_properties = {
+            'name': properties['name'],
+            'description': properties.get('description') or '',
+        }
+        # The color of the existing label is kept if the label does not have a color.
+        if properties.get('color'):
+            gen_properties['color'] = f"#{properties['color'].lstrip('#')}"
+        return gen_properties
+
+    def label_id(self, label_name):
+        # Gitea API identifies labels by their id which is retrieved when the existing labels are extracted
+        return self.existing_extractor.label_ids[label_name.lower()]
+
+    def create_session(self):
+        return client_session(headers=self.api_headers)
+
+    async def create_label(self, session, properties):
+        # Gitea API requires a color, hence a label without a color is created with the default color.
+        properties = {'color': DEFAULT_LABEL_COLOR, **properties}
+        async with session.post(self.labels_api_link, json=self.gen_gitea_properties(properties)) as response:
+            logger.debug('%s', response.request_info)
+            response.raise_for_status()
+            result = await response.json()
+            logger.debug('%s', LazyJson(result))
+            return result
+
+    async def update_label(self, session, label_name, new_properties):
+        async with session.patch(f'{self.labels_api_link}/{self.label_id(label_name)}',
+                                 json=self.gen_gitea_properties(new_properties)) as response:
+            logger.debug('%s', response.request_info)
+            response.raise_for_status()
+            result = await response.json()
+            logger.debug('%s', LazyJson(result))
+            return result
+
+    async def delete_label(self, session, label_name):
+        async with session.delete(f'{self.labels_api_link}/{self.label_id(label_name)}') as response:
+            logger.debug('%s', response.request_info)
+            response.raise_for_status()
+            return True
@@ -0,0 +1,71 @@
+"""
+This module contains the importer for GitLab.
+GitLab: https://gitlab.com/
+"""
+
+import logging
+
+from extractors.gitlab_extractor import GitLabExtractor
+from importers.base_importer import BaseImporter
+from utilities.config import Credentials
+from utilities.http_traffic import client_session
+from utilities.label_normalization import DEFAULT_LABEL_COLOR
+from utilities.logging_config import LazyJson
+from urllib.parse import quote
+
+logger = logging.getLogger(__name__)
+
+
+class GitLabImporter(BaseImporter):
+    extractor_class = GitLabExtractor
+
+    def __init__(self, link, loaded_json_data, api_base_url=None, credentials: Credentials = None):
+        super().__init__(link, loaded_json_data, api_base_url, credentials)
+        extractor = GitLabExtractor(link, self.api_base_url, credentials)
+        self.repo_owner, self.repo_name = extractor.repo_owner, extractor.repo_name
+        self.labels_api_link = extractor.labels_api_link
+        self.api_headers = extractor.api_headers
+
+    @staticmethod
+    def gen_gitlab_properties(properties):
+        gen_properties = {
+            'name': properties['name'],
+            'description': properties.get('description') or '',
+        }
+        # The color of the existing label is kept if the label does not have a color.
+        # GitLab API requires the colors to be prefixed with #
+        if properties.get('color'):
+            gen_properties['color'] = f"#{properties['color'].lstrip('#')}"
+        return gen_properties
+
+    def create_session(self):
+        return client_session(headers=self.api_headers)
+
+    async def create_label(self, session, properties):
+        # GitLab API requires a color, hence a label without a color is created with the default color.
+        properties = {'color': DEFAULT_LABEL_COLOR, **properties}
+        async with session.post(self.labels_api_link, json=self.gen_gitlab_properties(properties)) as response:
+            logger.debug('%s', response.request_info)
+            response.raise_for_status()
+            result = await response.json()
+            logger.debug('%s', LazyJson(result))
+            return result
+
+    async def update_label(self, session, label_name, new_properties):
+        # GitLab API identifies the label by its id or its url encoded name and renames it through new_name
+        new_properties = self.gen_gitlab_properties(new_properties)
+        new_properties['new_name'] = new_properties['name']
+        del new_properties['name']
+        async with session.put(f"{self.labels_api_link}/{quote(label_name, safe='')}",
+                               json=new_properties) as response:
+            logger.debug('%s', response.request_info)
+            response.raise_for_status()
+            result = await response.json()
+            logger.debug('%s', LazyJson(result))
+            return result
+
+    async def delete_label(self, session, label_name):
+        async with session.delete(f"{self.labels_api_link}/{quote(label_name, safe='')}") as response:
+            logger.debug('%s', response.request_info)
+            response.raise_for_status()
+            return True
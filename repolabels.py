@@ -9,9 +9,15 @@ import sys
 import logging
 
 from pathlib import Path
-from utilities.cli_utils import open_link, run_extractor, format_url, run_importer, rate_limits, validate_url, \
-    check_updates
-from utilities.constants import ImportModes
+from utilities.cli_utils import DEFAULT_WATCH_INTERVAL, open_link, run_extractor, format_url, run_importer, \
+    rate_limits, validate_url, check_updates
+from utilities.audit import DEFAULT_AUDIT_CONCURRENCY, run_audit
+from utilities.constants import AuditExitCodes, EstimateCommands, ImportModes, TrafficModes
+from utilities.cost_estimate import run_estimate
+from utilities.http_traffic import DEFAULT_REQUEST_TIMEOUT, configure_request_timeout, configure_traffic
+from utilities.logging_config import LOG_FORMATS, LazyJson, setup_logging
+from utilities.request_coalescing import configure_request_cache
+from utilities.run_control import configure_run_control
 from datetime import datetime
 
 SOFTWARE_NAME = "Repository Labels command line interface"
@@ -22,21 +28,41 @@ MAIN_EXPORT_DIRECTORY = Path.cwd().joinpath('exported')
 # if the default: exported/exported.json is used.
 DEFAULT_EXPORT_FILE_NAME = 'exported.json'
 
-debug_mode = False
-
-# noinspection PyArgumentList
-# Known Pycharm issue: https://youtrack.jetbrains.com/issue/PY-39762
-logging.basicConfig(level=logging.DEBUG if debug_mode else logging.INFO,
-                    format="%(asctime)s %(name)s %(funcName)s [%(levelname)s] %(message)s"
-                    if debug_mode else "%(asctime)s [%(levelname)s] %(message)s",
-                    handlers=[logging.FileHandler('repolabels.log', mode='w'), logging.StreamHandler(sys.stdout)])
 logger = logging.getLogger(__name__)
 
 
-def main():  # noqa: C901
+def main(notify_updates=False):  # noqa: C901
     parser = argparse.ArgumentParser(
         description=f'{SOFTWARE_NAME} is a command line interface to manage GitHub Repository labels.')
     parser.add_argument('--version', action='version', version=f'{SOFTWARE_NAME} Version {VERSION}')
+    parser.add_argument('--debug', action='store_true',
+                        help="Logs debug information including the request and response payloads.")
+    parser.add_argument('--log-file', type=Path, default=None,
+                        help="The log file path in which the logs of the current run will be appended to. "
+                             "(default log file path: 'logs/repolabels_{current date and time}.log')")
+    parser.add_argument('--log-format', choices=LOG_FORMATS, default='text',
+                        help="The format of the records written to the log file. (default: text)")
+    parser.add_argument('--cache-ttl', type=float, default=0,
+                        help="The number of seconds the retrieved labels are cached for within the current run, "
+                             "0 disables the cache. (default: 0)")
+    parser.add_argument('--request-timeout', type=float, default=DEFAULT_REQUEST_TIMEOUT,
+                        help="The number of seconds each request has to complete within, 0 disables the timeout. "
+                             f"(default: {DEFAULT_REQUEST_TIMEOUT})")
+    parser.add_argument('--deadline', type=float, default=None,
+                        help="The number of seconds the whole command has to complete within. Once exceeded, "
+                             "the requests in flight are cancelled and a partial report is logged.")
+    parser.add_argument('--partial-report', type=Path, default=None,
+                        help="The json file path which the completed, failed and pending operations are written to "
+                             "if the command is interrupted, exceeds its deadline or a request fails.")
+    traffic_group = parser.add_mutually_exclusive_group()
+    traffic_group.add_argument('--record', type=Path, metavar='RECORD_DIRECTORY',
+                               help="Records every HTTP request and response of the current run to the directory.")
+    traffic_group.add_argument('--replay', type=Path, metavar='REPLAY_DIRECTORY',
+                               help="Serves the HTTP responses recorded in the directory instead of "
+                                    "sending the requests to the services.")
+    parser.add_argument('--replay-time-scale', type=float, default=1.0,
+                        help="The multiplier applied to the recorded response times when replaying, "
+                             "0 replays without any delay. (default: 1.0)")
 
     subparsers = parser.add_subparsers(description="A list of possible subcommands")
 
@@ -76,11 +102,64 @@ def main():  # noqa: C901
     parser_rm_all.add_argument('rm_all_repo_link',
                                help="Link to the repository which the labels will be deleted.")
 
+    # Parser for "audit" subcommand
+    parser_audit = subparsers.add_parser('audit',
+                                         help="Reports the missing, extra and mismatched labels of the repositories "
+                                              "which have drifted from the template without modifying them.")
+    parser_audit.add_argument('audit_template',
+                              help="The json file path or the link to the repository which the labels are "
+                                   "compared against.")
+    parser_audit.add_argument('audit_repo_links', nargs='*',
+                              help="Links to the repositories to be audited.")
+    parser_audit.add_argument('--org', dest='audit_org_links', action='append', default=[],
+                              help="Link to the organisation whose repositories are all audited. "
+                                   "It can be used more than once.")
+    parser_audit.add_argument('-c', '--concurrency', type=int, default=DEFAULT_AUDIT_CONCURRENCY,
+                              help="The max number of concurrent read requests. "
+                                   f"(default: {DEFAULT_AUDIT_CONCURRENCY})")
+    parser_audit.add_argument('-r', '--report', dest='audit_report_file_path', type=Path,
+                              help="The json file path which the audit report will be written to.")
+
     # Parser for "rate-limit" subcommand
     parser_rate_limit = subparsers.add_parser('rate-limit',
                                               help="Retrieves the rate limit information for each services.")
+    parser_rate_limit.add_argument('rate_limit_services', nargs='*',
+                                   help="Links to the services. (default: https://github.com)")
+    parser_rate_limit.add_argument('-w', '--watch', action='store_true',
+                                   help="Refreshes the rate limit of every resource of the services until "
+                                        "the command is interrupted.")
+    parser_rate_limit.add_argument('-i', '--interval', type=float, default=DEFAULT_WATCH_INTERVAL,
+                                   help="The number of seconds between the refreshes when watching. "
+                                        f"(default: {DEFAULT_WATCH_INTERVAL})")
     parser_rate_limit.set_defaults(rate_limit_func=rate_limits)
 
+    # Parser for "estimate" subcommand
+    parser_estimate = subparsers.add_parser('estimate',
+                                            help="Estimates the API calls of a planned 'sync', 'import' or 'rm-all' "
+                                                 "subcommand over the repositories and projects its completion time "
+                                                 "under the remaining rate limit without modifying any repository.")
+    estimate_subparsers = parser_estimate.add_subparsers(description="The planned subcommand", required=True)
+    parser_estimate_sync = estimate_subparsers.add_parser('sync', help="Estimates syncing to the repositories.")
+    parser_estimate_sync.add_argument('estimate_src',
+                                      help="Link to the repository which the labels will be exported from.")
+    parser_estimate_sync.set_defaults(estimate_command=EstimateCommands.SYNC)
+    parser_estimate_import = estimate_subparsers.add_parser('import',
+                                                            help="Estimates importing to the repositories.")
+    parser_estimate_import.add_argument('estimate_src',
+                                        help="The source json file path in which the labels will be imported from.")
+    parser_estimate_import.set_defaults(estimate_command=EstimateCommands.IMPORT)
+    parser_estimate_rm_all = estimate_subparsers.add_parser('rm-all',
+                                                            help="Estimates removing all labels from the "
+                                                                 "repositories.")
+    parser_estimate_rm_all.set_defaults(estimate_command=EstimateCommands.RM_ALL, estimate_src=None)
+    for current_parser in [parser_estimate_sync, parser_estimate_import, parser_estimate_rm_all]:
+        current_parser.add_argument('estimate_repo_links', nargs='+',
+                                    help="Links to the repositories which the labels are to be imported to "
+                                         "or deleted from.")
+        current_parser.add_argument('--refresh', dest='estimate_refresh', action='store_true',
+                                    help="Retrieves the number of labels of every repository instead of using "
+                                         "the cached label counts.")
+
     # Parser for "update-cli" subcommand
     parser_update_cli = subparsers.add_parser('update-cli',
                                               help=f"Retrieves the latest stable version of {SOFTWARE_NAME}.")
@@ -93,8 +172,34 @@ def main():  # noqa: C901
 
     args = parser.parse_args()
 
+    setup_logging(args.debug, args.log_file, args.log_format)
+
+    configure_run_control(args.deadline, args.partial_report)
+    configure_request_timeout(args.request_timeout)
+    configure_request_cache(args.cache_ttl)
+
+    if args.record:
+        # The recorded exchanges of an earlier run would be partially overwritten and replayed with this run.
+        if args.record.exists() and (not args.record.is_dir() or any(args.record.iterdir())):
+            logger.error(f'Please ensure that {args.record} is a new or empty directory to record HTTP traffic to.')
+            raise SystemExit(1)
+        configure_traffic(TrafficModes.RECORD, args.record)
+    elif args.replay:
+        if not args.replay.is_dir():
+            logger.error(f'Please ensure that {args.replay} is a directory of recorded HTTP traffic.')
+            raise SystemExit(1)
+        configure_traffic(TrafficModes.REPLAY, args.replay, args.replay_time_scale)
+
+    if notify_updates:
+        latest_version = check_updates(MAIN_PROJECT_REPO_LINK)
+        if latest_version != VERSION:
+            logger.info(f'A new stable version of {SOFTWARE_NAME} Version {VERSION} is available.')
+            logger.info("You can use the \'update-cli\' subcommand to retrieve the latest stable version. Thank you.")
+
     logger.info("Start executing script")
 
+    exit_code = 0
+
     if hasattr(args, 'func'):
         args.func(args)
 
@@ -150,7 +255,7 @@ def main():  # noqa: C901
         # Load the labels from the source json file path
         with open(args.src_json_file_path, mode='r') as json_file:
             loaded_json_data = json.load(json_file)
-            logger.debug("The data read from json file:", loaded_json_data)
+            logger.debug("The data read from json file: %s", LazyJson(loaded_json_data))
 
             if loaded_json_data:
                 validate_url(args.import_cmd_repo_link)
@@ -179,9 +284,37 @@ def main():  # noqa: C901
                 logger.info(
                     f'Labels in {args.rm_all_repo_link} have been successfully deleted.')
 
+    # The logic for "audit" subcommand
+    if hasattr(args, 'audit_template'):
+        if not args.audit_repo_links and not args.audit_org_links:
+            parser_audit.error('Please provide the links to the repositories or organisations to be audited.')
+        # An invalid link fails the audit instead of being reported as drift.
+        for link in [*args.audit_repo_links, *args.audit_org_links]:
+            validate_url(link, AuditExitCodes.AUDIT_FAILED)
+        # The template is a link to a template repository if it is not a json file.
+        template = args.audit_template
+        if not Path(template).is_file():
+            validate_url(template, AuditExitCodes.AUDIT_FAILED)
+            template = format_url(template)
+        exit_code = run_audit(template, [format_url(repo_link) for repo_link in args.audit_repo_links],
+                              [format_url(org_link) for org_link in args.audit_org_links], args.concurrency,
+                              args.audit_report_file_path)
+
+    # The logic for "estimate" subcommand
+    if hasattr(args, 'estimate_command'):
+        for repo_link in args.estimate_repo_links:
+            validate_url(repo_link)
+        src = format_url(args.estimate_src) if args.estimate_command == EstimateCommands.SYNC else args.estimate_src
+        exit_code = run_estimate(args.estimate_command, src,
+                                 [format_url(repo_link) for repo_link in args.estimate_repo_links],
+                                 args.estimate_refresh, args.cache_ttl)
+
     # The logic for "rate-limit" subcommand
     if hasattr(args, 'rate_limit_func'):
-        args.rate_limit_func()
+        for service in args.rate_limit_services:
+            validate_url(service)
+        args.rate_limit_func([format_url(service) for service in args.rate_limit_services], args.watch,
+                             args.interval)
 
     # The logic for "update-cli" subcommand
     if hasattr(args, 'update_cli_func'):
@@ -202,10 +335,9 @@ def main():  # noqa: C901
 
     logger.info("Script execution completed")
 
+    if exit_code:
+        raise SystemExit(exit_code)
+
 
 if __name__ == "__main__":
-    latest_version = check_updates(MAIN_PROJECT_REPO_LINK)
-    if latest_version != VERSION:
-        logger.info(f'A new stable version of {SOFTWARE_NAME} Version {VERSION} is available.')
-        logger.info("You can use the \'update-cli\' subcommand to retrieve the latest stable version. Thank you.")
-    main()
+    main(notify_updates=True)
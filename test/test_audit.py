@@ -0,0 +1,56 @@
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from exceptions.general_exceptions import AuditError
+from extractors.github_extractor import GitHubExtractor
+from utilities.audit import audit_repo, request_org_repo_links
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import patch
+
+
+class Test(IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.app = web.Application()
+        self.server = TestServer(self.app)
+
+    async def asyncTearDown(self):
+        await self.server.close()
+
+    def github_extractor(self, link):
+        return GitHubExtractor(link, str(self.server.make_url('')).rstrip('/'))
+
+    async def test_request_org_repo_links_input_not_found_org_raises_audit_error(self):
+        async def not_found(request):
+            return web.json_response({'message': 'Not Found'}, status=404)
+
+        self.app.router.add_get('/orgs/{org}/repos', not_found)
+        self.app.router.add_get('/users/{org}/repos', not_found)
+        await self.server.start_server()
+        with patch('utilities.audit.ExtractorFacade.execute', self.github_extractor):
+            with self.assertRaises(AuditError) as cm:
+                await request_org_repo_links('https://github.com/no-such-org')
+        self.assertEqual('AuditError: https://github.com/no-such-org organisation was not found.', cm.exception.message)
+
+    async def test_request_org_repo_links_input_user_returns_user_repo_links(self):
+        async def not_found(request):
+            return web.json_response({'message': 'Not Found'}, status=404)
+
+        async def list_user_repos(request):
+            return web.json_response([{'html_url': 'https://github.com/lwhjon/repo-labels-cli', 'archived': False},
+                                      {'html_url': 'https://github.com/lwhjon/archived', 'archived': True}])
+
+        self.app.router.add_get('/orgs/{org}/repos', not_found)
+        self.app.router.add_get('/users/{org}/repos', list_user_repos)
+        await self.server.start_server()
+        with patch('utilities.audit.ExtractorFacade.execute', self.github_extractor):
+            self.assertEqual(['https://github.com/lwhjon/repo-labels-cli'],
+                             await request_org_repo_links('https://github.com/lwhjon'))
+
+    async def test_audit_repo_input_unexpected_error_returns_failed_audit_result(self):
+        async def unexpected_payload(repo_link):
+            raise KeyError('name')
+
+        with patch('utilities.audit.request_link_labels', unexpected_payload):
+            audit_result = await audit_repo('https://github.com/lwhjon/repo-labels-cli', {})
+        self.assertIsNone(audit_result.label_diff)
+        self.assertEqual("KeyError: 'name'", audit_result.error)
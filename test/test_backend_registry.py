@@ -0,0 +1,57 @@
+from exceptions.general_exceptions import SiteNotSupported
+from utilities.backend_registry import BACKENDS, get_host_configuration, load_class, parse_hosts
+from utilities.config import Credentials
+from utilities.extractor_facade import ExtractorFacade
+from unittest import TestCase
+from unittest.mock import patch
+
+
+class Test(TestCase):
+
+    def test_parse_hosts_input_host_without_api_base_url_returns_default_api_base_url_of_backend(self):
+        hosts = parse_hosts('github.example.com=github, gitea.example.com=gitea')
+        self.assertEqual('https://github.example.com/api/v3', hosts['github.example.com'].api_base_url)
+        self.assertEqual(BACKENDS['gitea'], hosts['gitea.example.com'].backend)
+
+    def test_parse_hosts_input_host_with_api_base_url_returns_input_api_base_url(self):
+        hosts = parse_hosts('GitLab.Example.com=gitlab@https://gitlab.example.com/gitlab/api/v4/')
+        self.assertEqual('https://gitlab.example.com/gitlab/api/v4', hosts['gitlab.example.com'].api_base_url)
+
+    def test_parse_hosts_input_host_with_credentials_returns_input_credentials_prefix(self):
+        hosts = parse_hosts('github.example.com=github:GHE@https://github.example.com/api/v3, gitea.example.com=gitea')
+        self.assertEqual('GHE', hosts['github.example.com'].credentials_prefix)
+        self.assertEqual('https://github.example.com/api/v3', hosts['github.example.com'].api_base_url)
+        self.assertEqual('GITEA_EXAMPLE_COM', hosts['gitea.example.com'].credentials_prefix)
+
+    def test_parse_hosts_input_unknown_backend_ignores_host_and_log_error_msg(self):
+        with self.assertLogs('utilities.backend_registry', level='ERROR'):
+            hosts = parse_hosts('bitbucket.org=bitbucket')
+        self.assertEqual({}, hosts)
+
+    def test_get_host_configuration_input_github_hostname_returns_github_api_base_url(self):
+        host_configuration = get_host_configuration('github.com')
+        self.assertEqual(BACKENDS['github'], host_configuration.backend)
+        self.assertEqual('https://api.github.com', host_configuration.api_base_url)
+
+    def test_get_host_configuration_input_not_supported_hostname_raises_site_not_supported(self):
+        with self.assertRaises(SiteNotSupported):
+            get_host_configuration('notsupported.com')
+
+    def test_load_class_input_gitlab_extractor_path_returns_gitlab_extractor(self):
+        extractor_class = load_class(BACKENDS['gitlab'].extractor_path)
+        extractor = extractor_class('https://gitlab.com/group/subgroup/project/-/labels')
+        self.assertEqual('GitLabExtractor', extractor_class.__name__)
+        self.assertEqual(('group/subgroup', 'project'), (extractor.repo_owner, extractor.repo_name))
+        self.assertEqual('https://gitlab.com/api/v4/projects/group%2Fsubgroup%2Fproject/labels',
+                         extractor.labels_api_link)
+
+    @patch.dict('os.environ', {'GITHUB_USERNAME': 'username', 'GITHUB_PERSONAL_ACCESS_TOKEN': 'token'})
+    def test_extractor_facade_input_github_link_returns_extractor_with_github_credentials(self):
+        extractor = ExtractorFacade.execute('https://github.com/lwhjon/repo-labels-cli')
+        self.assertEqual(('username', 'token'), (extractor.authentication.login, extractor.authentication.password))
+
+    def test_load_class_input_gitea_extractor_path_with_credentials_returns_gitea_extractor_with_token(self):
+        extractor = load_class(BACKENDS['gitea'].extractor_path)('https://gitea.example.com/owner/repo',
+                                                                 'https://gitea.example.com/api/v1',
+                                                                 Credentials(None, 'token'))
+        self.assertEqual({'Authorization': 'token token'}, extractor.api_headers)
@@ -1,6 +1,9 @@
 import argparse
 
-from utilities.cli_utils import open_link, remove_url_trailing_slash, format_url, run_extractor
+from datetime import datetime
+from extractors.base_extractor import RateLimit
+from utilities.cli_utils import open_link, remove_url_trailing_slash, format_url, run_extractor, \
+    format_rate_limit_resources, rate_limits
 from unittest import TestCase
 from unittest.mock import patch
 
@@ -40,3 +43,32 @@ class Test(TestCase):
         self.assertEqual(
             "ERROR:utilities.extractor_facade:SiteNotSupported: notsupported.com Repository host not supported.",
             cm.output[len(cm.output) - 1])
+
+    def test_format_rate_limit_resources_input_previous_resources_returns_used_since_last_refresh(self):
+        reset_time = datetime(2026, 1, 1, 13, 0, 0)
+        self.assertEqual("\n\nGitHub API Rate Limits Information\n"
+                         "==================================\n"
+                         "Resource  Limit  Remaining  Used  Used since last refresh  Resets at\n"
+                         "core      5000   4990       10    4                        2026-01-01 13:00:00\n"
+                         "search    30     30         0     -                        2026-01-01 13:00:00\n",
+                         format_rate_limit_resources('GitHub API', {
+                             'core': RateLimit(5000, 4990, 10, reset_time),
+                             'search': RateLimit(30, 30, 0, reset_time),
+                         }, {'core': RateLimit(5000, 4994, 6, reset_time)}))
+
+    def test_rate_limits_input_not_supported_service_logs_site_not_supported_error_msg(self):
+        with self.assertLogs('utilities.extractor_facade', level='ERROR') as cm:
+            rate_limits(['https://notsupported.com'])
+        self.assertEqual(
+            "ERROR:utilities.extractor_facade:SiteNotSupported: notsupported.com Repository host not supported.",
+            cm.output[len(cm.output) - 1])
+
+    @patch('utilities.cli_utils.watch_rate_limits')
+    def test_rate_limits_watch_input_interrupted_stops_watching_without_error(self, mock_watch_rate_limits):
+        async def interrupted_watch(services, interval):
+            raise KeyboardInterrupt
+
+        mock_watch_rate_limits.side_effect = interrupted_watch
+        with self.assertLogs('utilities.cli_utils', level='INFO') as cm:
+            rate_limits(['https://github.com'], watch=True)
+        self.assertEqual(['INFO:utilities.cli_utils:Stopped watching the rate limits.'], cm.output)
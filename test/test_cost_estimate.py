@@ -0,0 +1,68 @@
+import tempfile
+
+from datetime import datetime, timedelta
+from pathlib import Path
+from extractors.base_extractor import RateLimit
+from extractors.github_extractor import GitHubExtractor
+from extractors.gitlab_extractor import GitLabExtractor
+from utilities.constants import EstimateCommands
+from utilities.cost_estimate import ApiCalls, estimate_command_calls, label_cache_ttl, num_of_pages, \
+    project_completion_time
+from utilities.label_counts import forget_label_counts, load_label_counts, record_label_counts
+from unittest import TestCase
+
+REPO_LINK = 'https://github.com/lwhjon/repo-labels-cli'
+NOW = datetime(2026, 1, 1, 12, 0, 0)
+
+
+class Test(TestCase):
+
+    def test_num_of_pages_input_no_labels_returns_one_page(self):
+        self.assertEqual(1, num_of_pages(0, 100))
+
+    def test_num_of_pages_input_partial_last_page_returns_rounded_up_pages(self):
+        self.assertEqual(3, num_of_pages(250, 100))
+
+    def test_estimate_command_calls_input_rm_all_returns_labels_retrieved_twice_and_every_label_deleted(self):
+        self.assertEqual(ApiCalls(REPO_LINK, 250, 6, 250, 250),
+                         estimate_command_calls(EstimateCommands.RM_ALL, REPO_LINK, 250, 100))
+
+    def test_estimate_command_calls_input_rm_all_with_cache_ttl_returns_labels_retrieved_once(self):
+        self.assertEqual(ApiCalls(REPO_LINK, 250, 3, 250, 250),
+                         estimate_command_calls(EstimateCommands.RM_ALL, REPO_LINK, 250, 100, cache_ttl=60))
+
+    def test_label_cache_ttl_input_backend_without_label_requests_returns_no_cache_ttl(self):
+        self.assertEqual(60, label_cache_ttl(GitHubExtractor, 60))
+        self.assertEqual(0, label_cache_ttl(GitLabExtractor, 60))
+
+    def test_estimate_command_calls_input_import_returns_min_and_max_writes(self):
+        self.assertEqual(ApiCalls(REPO_LINK, 120, 2, 130, 370),
+                         estimate_command_calls(EstimateCommands.IMPORT, REPO_LINK, 120, 100, 250))
+
+    def test_estimate_command_calls_input_import_no_desired_labels_returns_no_calls(self):
+        self.assertEqual(ApiCalls(REPO_LINK, 120, 0, 0, 0),
+                         estimate_command_calls(EstimateCommands.IMPORT, REPO_LINK, 120, 100, 0))
+
+    def test_project_completion_time_input_calls_within_remaining_rate_limit_returns_now(self):
+        rate_limit = RateLimit(5000, 4000, 1000, NOW + timedelta(minutes=30))
+        self.assertEqual(NOW, project_completion_time(4000, rate_limit, 3600, NOW))
+
+    def test_project_completion_time_input_calls_beyond_remaining_rate_limit_returns_later_rate_limit_window(self):
+        reset_time = NOW + timedelta(minutes=30)
+        rate_limit = RateLimit(5000, 1000, 4000, reset_time)
+        self.assertEqual(reset_time, project_completion_time(6000, rate_limit, 3600, NOW))
+        self.assertEqual(reset_time + timedelta(hours=1), project_completion_time(6001, rate_limit, 3600, NOW))
+
+    def test_record_label_counts_input_label_counts_returns_cached_label_counts(self):
+        with tempfile.TemporaryDirectory() as temp_directory:
+            file_path = Path(temp_directory).joinpath('cache', 'label_counts.json')
+            self.assertEqual({}, load_label_counts(file_path))
+            record_label_counts({REPO_LINK: 9}, file_path)
+            self.assertEqual(9, load_label_counts(file_path)[REPO_LINK]['num_of_labels'])
+
+    def test_forget_label_counts_input_cached_repo_link_returns_cache_without_repo_link(self):
+        with tempfile.TemporaryDirectory() as temp_directory:
+            file_path = Path(temp_directory).joinpath('cache', 'label_counts.json')
+            record_label_counts({REPO_LINK: 9, 'https://github.com/github/docs': 3}, file_path)
+            forget_label_counts([REPO_LINK], file_path)
+            self.assertEqual(['https://github.com/github/docs'], list(load_label_counts(file_path)))
@@ -0,0 +1,134 @@
+import asyncio
+import json
+import tempfile
+import time
+
+from aiohttp import ClientResponseError, web
+from aiohttp.test_utils import TestServer
+from pathlib import Path
+from exceptions.general_exceptions import RecordedExchangeNotFound
+from utilities.constants import TrafficModes
+from utilities.http_traffic import client_session, close_shared_client_session, configure_traffic, exchange_key, \
+    limit_concurrent_requests, shared_client_session
+from unittest import IsolatedAsyncioTestCase
+
+
+async def list_labels(request):
+    return web.json_response([{'name': 'bug', 'color': 'd73a4a', 'page': request.query['page']}],
+                             headers={'Link': f'<{request.url.with_query(page=2)}>; rel="last"'})
+
+
+class Test(IsolatedAsyncioTestCase):
+
+    async def slow_labels(self, request):
+        self.num_of_requests_in_flight += 1
+        self.max_num_of_requests_in_flight = max(self.max_num_of_requests_in_flight, self.num_of_requests_in_flight)
+        await asyncio.sleep(0.02)
+        self.num_of_requests_in_flight -= 1
+        return web.json_response([])
+
+    async def list_peer(self, request):
+        self.peers.append(request.transport.get_extra_info('peername'))
+        return web.json_response([])
+
+    async def asyncSetUp(self):
+        self.num_of_requests_in_flight = 0
+        self.max_num_of_requests_in_flight = 0
+        self.peers = []
+        app = web.Application()
+        app.router.add_get('/labels', list_labels)
+        app.router.add_get('/slow', self.slow_labels)
+        app.router.add_get('/peer', self.list_peer)
+        self.server = TestServer(app)
+        await self.server.start_server()
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    async def asyncTearDown(self):
+        configure_traffic(TrafficModes.LIVE)
+        await self.server.close()
+        self.temp_dir.cleanup()
+
+    def test_exchange_key_input_reordered_params_returns_same_key(self):
+        self.assertEqual(exchange_key('get', 'https://api.github.com/labels?per_page=100', {'page': 1}),
+                         exchange_key('GET', 'https://api.github.com/labels', {'page': 1, 'per_page': 100}))
+
+    async def test_client_session_replay_mode_input_recorded_request_returns_recorded_response(self):
+        labels_url = str(self.server.make_url('/labels'))
+
+        configure_traffic(TrafficModes.RECORD, self.temp_dir.name)
+        async with client_session() as session:
+            async with session.get(labels_url, params={'page': 1}) as response:
+                recorded_labels = await response.json()
+
+        await self.server.close()
+
+        configure_traffic(TrafficModes.REPLAY, self.temp_dir.name, time_scale=0)
+        async with client_session() as session:
+            async with session.get(labels_url, params={'page': 1}) as response:
+                self.assertEqual(200, response.status)
+                self.assertEqual(recorded_labels, await response.json())
+                self.assertEqual(f'{labels_url}?page=2', str(response.links.get('last').get('url')))
+
+    async def test_client_session_replay_mode_input_unrecorded_request_raises_recorded_exchange_not_found(self):
+        configure_traffic(TrafficModes.REPLAY, self.temp_dir.name, time_scale=0)
+        async with client_session() as session:
+            with self.assertRaises(RecordedExchangeNotFound):
+                async with session.get(str(self.server.make_url('/labels')), params={'page': 1}):
+                    pass
+
+    async def test_client_session_replay_mode_input_recorded_error_response_raises_client_response_error(self):
+        missing_url = str(self.server.make_url('/missing'))
+
+        configure_traffic(TrafficModes.RECORD, self.temp_dir.name)
+        async with client_session() as session:
+            async with session.get(missing_url) as response:
+                self.assertEqual(404, response.status)
+
+        configure_traffic(TrafficModes.REPLAY, self.temp_dir.name, time_scale=0)
+        async with client_session() as session:
+            async with session.get(missing_url) as response:
+                with self.assertRaises(ClientResponseError) as cm:
+                    response.raise_for_status()
+        self.assertEqual(404, cm.exception.status)
+        self.assertEqual(missing_url, str(cm.exception.request_info.real_url))
+
+    async def test_client_session_replay_mode_input_recorded_offset_holds_back_request_until_offset(self):
+        labels_url = str(self.server.make_url('/labels'))
+        Path(self.temp_dir.name).joinpath('00001_get.json').write_text(json.dumps({
+            'method': 'GET', 'url': labels_url, 'params': None, 'request_json': None,
+            'key': exchange_key('GET', labels_url), 'started_at': 0.2, 'elapsed': 0.1, 'status': 200,
+            'headers': [], 'links': {}, 'body': '[]',
+        }))
+
+        configure_traffic(TrafficModes.REPLAY, self.temp_dir.name)
+        started_at = time.perf_counter()
+        async with client_session() as session:
+            async with session.get(labels_url) as response:
+                self.assertEqual([], await response.json())
+        self.assertGreaterEqual(time.perf_counter() - started_at, 0.3)
+
+    async def test_client_session_input_limited_concurrent_requests_bounds_requests_across_sessions(self):
+        slow_url = str(self.server.make_url('/slow'))
+
+        async def request_pages():
+            async with client_session() as session:
+                async def request_page(page):
+                    async with session.get(slow_url, params={'page': page}) as response:
+                        return await response.json()
+                return await asyncio.gather(*[request_page(page) for page in range(4)])
+
+        limit_concurrent_requests(3)
+        await asyncio.gather(*[request_pages() for _ in range(3)])
+        self.assertEqual(3, self.max_num_of_requests_in_flight)
+
+    async def test_shared_client_session_input_sequential_requests_reuses_connection(self):
+        for _ in range(2):
+            async with shared_client_session().get(str(self.server.make_url('/peer'))) as response:
+                await response.json()
+        session = shared_client_session()
+        await close_shared_client_session()
+
+        self.assertEqual(1, len(set(self.peers)))
+        self.assertTrue(session.closed)
+        self.assertIsNot(session, shared_client_session())
+        await close_shared_client_session()
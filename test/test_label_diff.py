@@ -0,0 +1,53 @@
+from utilities.audit import AuditResult, format_audit_result
+from utilities.label_diff import diff_labels, diff_label_properties
+from unittest import TestCase
+
+BUG_LABEL = {'name': 'bug', 'color': 'd73a4a', 'description': "Something isn't working"}
+DOCS_LABEL = {'name': 'documentation', 'color': '0075ca', 'description': 'Improvements or additions to documentation'}
+WONTFIX_LABEL = {'name': 'wontfix', 'color': 'ffffff', 'description': 'This will not be worked on'}
+
+
+class Test(TestCase):
+
+    def test_diff_labels_input_identical_labels_returns_no_drift(self):
+        label_diff = diff_labels({'bug': BUG_LABEL}, {'bug': {**BUG_LABEL}})
+        self.assertFalse(label_diff.has_drift)
+        self.assertEqual(['bug'], label_diff.unchanged)
+
+    def test_diff_labels_input_different_labels_returns_missing_extra_and_mismatched_labels(self):
+        label_diff = diff_labels({'bug': BUG_LABEL, 'documentation': DOCS_LABEL},
+                                 {'bug': {**BUG_LABEL, 'color': 'ffffff'}, 'wontfix': WONTFIX_LABEL})
+        self.assertTrue(label_diff.has_drift)
+        self.assertEqual(['documentation'], label_diff.missing)
+        self.assertEqual(['wontfix'], label_diff.extra)
+        self.assertEqual(['bug'], label_diff.mismatched)
+        self.assertEqual([], label_diff.unchanged)
+
+    def test_diff_labels_input_desired_label_without_color_returns_no_drift(self):
+        label_diff = diff_labels({'bug': {'name': 'bug', 'description': "Something isn't working"}},
+                                 {'bug': BUG_LABEL})
+        self.assertFalse(label_diff.has_drift)
+        self.assertEqual({'description': ('', "Something isn't working")},
+                         diff_label_properties({'name': 'bug'}, BUG_LABEL))
+
+    def test_diff_labels_input_equivalent_labels_returns_no_drift(self):
+        label_diff = diff_labels({'bug': {**BUG_LABEL, 'color': '#D73A4A', 'id': 1}},
+                                 {'bug': BUG_LABEL})
+        self.assertFalse(label_diff.has_drift)
+        self.assertEqual({}, diff_label_properties({**WONTFIX_LABEL, 'description': None},
+                                                   {**WONTFIX_LABEL, 'description': ''}))
+
+    def test_diff_label_properties_input_different_color_returns_color_only(self):
+        self.assertEqual({'color': ('d73a4a', 'ffffff')},
+                         diff_label_properties(BUG_LABEL, {**BUG_LABEL, 'color': 'ffffff'}))
+
+    def test_format_audit_result_input_drifted_repo_returns_missing_extra_and_mismatched_labels(self):
+        label_diff = diff_labels({'bug': BUG_LABEL, 'documentation': DOCS_LABEL},
+                                 {'bug': {**BUG_LABEL, 'color': 'ffffff'}, 'wontfix': WONTFIX_LABEL})
+        audit_result = AuditResult('https://github.com/lwhjon/repo-labels-cli', label_diff,
+                                   {'bug': {'color': ('d73a4a', 'ffffff')}}, None)
+        self.assertEqual("https://github.com/lwhjon/repo-labels-cli: 1 missing, 1 extra and 1 mismatched labels.\n"
+                         "    Missing: documentation\n"
+                         "    Extra: wontfix\n"
+                         "    Mismatched bug: color (template: 'd73a4a', repository: 'ffffff')",
+                         format_audit_result(audit_result))
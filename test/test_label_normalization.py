@@ -0,0 +1,23 @@
+from utilities.label_normalization import normalize_label, normalize_labels
+from unittest import TestCase
+
+
+class Test(TestCase):
+
+    def test_normalize_label_input_uppercase_color_with_hash_returns_lowercase_color_without_hash(self):
+        self.assertEqual({'name': 'bug', 'color': 'd73a4a', 'description': "Something isn't working"},
+                         normalize_label({'name': 'bug', 'color': '#D73A4A', 'description': "Something isn't working"}))
+
+    def test_normalize_label_input_none_description_and_extra_keys_returns_empty_description_only(self):
+        self.assertEqual({'name': 'bug', 'color': 'd73a4a', 'description': ''},
+                         normalize_label({'name': 'bug', 'color': 'd73a4a', 'description': None, 'id': 1,
+                                          'default': True}))
+
+    def test_normalize_labels_input_hand_edited_labels_returns_labels_keyed_by_lowercase_name(self):
+        self.assertEqual({'bug': {'name': 'Bug', 'color': 'd73a4a', 'description': ''},
+                          'wontfix': {'name': 'wontfix', 'color': 'ffffff', 'description': ''}},
+                         normalize_labels({'BUG': {'name': 'Bug', 'color': 'D73A4A'},
+                                           'wontfix': {'color': '#ffffff'}}))
+
+    def test_normalize_label_input_missing_color_returns_label_without_color(self):
+        self.assertEqual({'name': 'bug', 'description': ''}, normalize_label({'name': 'bug', 'color': None}))
@@ -0,0 +1,55 @@
+import json
+import logging
+import tempfile
+
+from pathlib import Path
+from utilities.logging_config import LazyJson, JsonFormatter, remove_old_log_files, setup_logging, stop_logging
+from unittest import TestCase
+
+
+class Test(TestCase):
+
+    def test_lazy_json_input_dict_returns_json_string(self):
+        self.assertEqual('{"bug": {"color": "d73a4a"}}', str(LazyJson({'bug': {'color': 'd73a4a'}})))
+
+    def test_lazy_json_debug_disabled_does_not_serialise_payload(self):
+        logger = logging.getLogger('test_lazy_json')
+        logger.setLevel(logging.INFO)
+        # A set is not json serialisable hence serialising the payload would raise an error.
+        with self.assertLogs(logger, level='INFO'):
+            logger.debug('Payload: %s', LazyJson({'unserialisable'}))
+            logger.info('Done')
+
+    def test_json_formatter_input_record_with_extra_returns_json_with_extra_field(self):
+        record = logging.LogRecord('repolabels', logging.INFO, __file__, 1, 'Imported %d labels', (3,), None)
+        record.repo = 'lwhjon/repo-labels-cli'
+        log_entry = json.loads(JsonFormatter().format(record))
+        self.assertEqual('Imported 3 labels', log_entry['message'])
+        self.assertEqual('INFO', log_entry['level'])
+        self.assertEqual('lwhjon/repo-labels-cli', log_entry['repo'])
+
+    def test_setup_logging_input_log_file_path_writes_records_to_log_file(self):
+        root_logger = logging.getLogger()
+        original_handlers, original_level = root_logger.handlers[:], root_logger.level
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_file_path = Path(temp_dir).joinpath('nested', 'run.log')
+            try:
+                setup_logging(log_file_path=log_file_path, log_format='json')
+                logging.getLogger('test_setup_logging').info('Start executing script')
+            finally:
+                stop_logging()
+                root_logger.handlers = original_handlers
+                root_logger.setLevel(original_level)
+            log_entry = json.loads(log_file_path.read_text().splitlines()[-1])
+        self.assertEqual('Start executing script', log_entry['message'])
+        self.assertEqual('test_setup_logging', log_entry['logger'])
+
+    def test_remove_old_log_files_input_more_log_files_than_max_removes_oldest_default_log_files(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_directory = Path(temp_dir)
+            for log_file_name in ['repolabels_2026_01_01.log', 'repolabels_2026_01_02.log',
+                                  'repolabels_2026_01_03.log', 'custom.log']:
+                log_directory.joinpath(log_file_name).touch()
+            remove_old_log_files(log_directory, 2)
+            self.assertEqual(['custom.log', 'repolabels_2026_01_02.log', 'repolabels_2026_01_03.log'],
+                             sorted(path.name for path in log_directory.iterdir()))
@@ -0,0 +1,86 @@
+import asyncio
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from extractors.github_extractor import GitHubExtractor
+from utilities.http_traffic import close_shared_client_session
+from utilities.request_coalescing import RequestCoalescer
+from unittest import IsolatedAsyncioTestCase
+
+
+class Test(IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.num_of_requests = 0
+
+    async def request_labels(self):
+        self.num_of_requests += 1
+        await asyncio.sleep(0.01)
+        return [{'name': 'bug'}]
+
+    async def test_request_input_identical_concurrent_requests_sends_single_request(self):
+        coalescer = RequestCoalescer()
+        results = await asyncio.gather(*[coalescer.request('GET labels', self.request_labels) for _ in range(5)])
+        self.assertEqual(1, self.num_of_requests)
+        self.assertEqual([[{'name': 'bug'}]] * 5, results)
+        self.assertEqual(4, coalescer.num_of_coalesced_requests)
+        self.assertEqual({}, coalescer.in_flight_requests)
+
+    async def test_request_cache_disabled_input_sequential_requests_sends_every_request(self):
+        coalescer = RequestCoalescer()
+        await coalescer.request('GET labels', self.request_labels)
+        await coalescer.request('GET labels', self.request_labels)
+        self.assertEqual(2, self.num_of_requests)
+
+    async def test_request_cache_enabled_input_sequential_requests_serves_cached_result(self):
+        coalescer = RequestCoalescer(cache_ttl=60)
+        await coalescer.request('GET labels', self.request_labels)
+        self.assertEqual([{'name': 'bug'}], await coalescer.request('GET labels', self.request_labels))
+        self.assertEqual(1, self.num_of_requests)
+        self.assertEqual(1, coalescer.num_of_cached_requests)
+
+    async def test_invalidate_input_key_prefix_sends_request_again(self):
+        coalescer = RequestCoalescer(cache_ttl=60)
+        await coalescer.request('GET labels?page=1', self.request_labels)
+        coalescer.invalidate('GET labels')
+        await coalescer.request('GET labels?page=1', self.request_labels)
+        self.assertEqual(2, self.num_of_requests)
+
+    async def test_request_input_failed_request_raises_error_for_every_caller(self):
+        coalescer = RequestCoalescer(cache_ttl=60)
+
+        async def failed_request():
+            await asyncio.sleep(0.01)
+            raise ValueError('Not Found')
+
+        results = await asyncio.gather(*[coalescer.request('GET labels', failed_request) for _ in range(3)],
+                                       return_exceptions=True)
+        self.assertTrue(all(isinstance(result, ValueError) for result in results))
+        self.assertEqual({}, coalescer.cached_results)
+
+    async def test_get_labels_dict_input_cancelled_first_caller_returns_labels_to_coalesced_caller(self):
+        async def list_labels(request):
+            self.num_of_requests += 1
+            await asyncio.sleep(0.05)
+            return web.json_response([{'name': 'bug', 'color': 'd73a4a', 'description': None}])
+
+        app = web.Application()
+        app.router.add_get('/repos/{owner}/{repo}/labels', list_labels)
+        server = TestServer(app)
+        await server.start_server()
+        try:
+            api_base_url = str(server.make_url('')).rstrip('/')
+            params = {'per_page': 100, 'page': 1}
+            first_request = asyncio.ensure_future(
+                GitHubExtractor('https://github.com/lwhjon/cancelled', api_base_url).get_labels_dict(params))
+            await asyncio.sleep(0.01)
+            coalesced_request = asyncio.ensure_future(
+                GitHubExtractor('https://github.com/lwhjon/cancelled', api_base_url).get_labels_dict(params))
+            await asyncio.sleep(0.01)
+            first_request.cancel()
+
+            self.assertEqual({'bug': {'name': 'bug', 'color': 'd73a4a', 'description': ''}}, await coalesced_request)
+            self.assertEqual(1, self.num_of_requests)
+        finally:
+            await close_shared_client_session()
+            await server.close()
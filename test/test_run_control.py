@@ -0,0 +1,59 @@
+import asyncio
+
+from exceptions.general_exceptions import DeadlineExceeded, RecordedExchangeNotFound
+from utilities.constants import OperationStatus
+from utilities.run_control import OperationTracker, configure_run_control, describe_error, run_within_deadline
+from unittest import IsolatedAsyncioTestCase
+
+
+async def complete():
+    return 'completed'
+
+
+async def fail():
+    raise ValueError('failed')
+
+
+async def wait():
+    await asyncio.sleep(10)
+
+
+class Test(IsolatedAsyncioTestCase):
+
+    def tearDown(self):
+        configure_run_control()
+
+    async def test_operation_tracker_input_completed_failed_and_cancelled_operations_returns_their_status(self):
+        operation_tracker = OperationTracker()
+        self.assertEqual('completed', await operation_tracker.track('Complete', complete))
+        with self.assertRaises(ValueError):
+            await operation_tracker.track('Fail', fail)
+        pending_operation = asyncio.ensure_future(operation_tracker.track('Wait', wait))
+        await asyncio.sleep(0)
+        pending_operation.cancel()
+
+        self.assertEqual(['Complete'], [operation.description for operation in
+                                        operation_tracker.operations_by_status(OperationStatus.COMPLETED)])
+        self.assertEqual([('Fail', 'ValueError: failed')], [(operation.description, operation.error) for operation in
+                                                            operation_tracker.operations_by_status(
+                                                                OperationStatus.FAILED)])
+        self.assertEqual(['Wait'], [operation.description for operation in
+                                    operation_tracker.operations_by_status(OperationStatus.PENDING)])
+
+    async def test_run_within_deadline_input_slow_coroutine_raises_deadline_exceeded(self):
+        configure_run_control(0.05)
+        with self.assertRaises(DeadlineExceeded):
+            await run_within_deadline(wait())
+
+    async def test_run_within_deadline_input_request_timeout_before_deadline_raises_timeout_error(self):
+        async def time_out():
+            raise asyncio.TimeoutError
+
+        configure_run_control(10)
+        with self.assertRaises(asyncio.TimeoutError):
+            await run_within_deadline(time_out())
+
+    def test_describe_error_input_error_with_message_returns_message_without_repeated_type_name(self):
+        self.assertEqual('RecordedExchangeNotFound: GET labels was not found in the recorded HTTP traffic.',
+                         describe_error(RecordedExchangeNotFound('GET labels')))
+        self.assertEqual('ValueError: failed', describe_error(ValueError('failed')))
@@ -0,0 +1,230 @@
+"""
+This module contains the audit of repositories against a template of labels.
+The audit only reads the labels of the repositories, hence it never modifies any repository.
+"""
+
+import asyncio
+import json
+import logging
+
+import aiohttp
+
+from collections import namedtuple
+from functools import partial
+from pathlib import Path
+from urllib.parse import urlparse
+from exceptions.general_exceptions import AuditError
+from utilities.constants import AuditExitCodes
+from utilities.extractor_facade import ExtractorFacade
+from utilities.http_traffic import limit_concurrent_requests
+from utilities.label_counts import record_label_counts
+from utilities.label_diff import diff_labels, diff_label_properties
+from utilities.label_normalization import normalize_labels
+from utilities.run_control import describe_error, operation_tracker, run_async
+
+# The max number of concurrent read requests of the audit by default.
+DEFAULT_AUDIT_CONCURRENCY = 5
+
+logger = logging.getLogger(__name__)
+
+AuditResult = namedtuple('AuditResult', ['repo_link', 'label_diff', 'mismatched_properties', 'error'])
+
+
+async def request_link_labels(repo_link):
+    """
+    Returns the labels of the repository.
+    :param repo_link: The link to the repository
+    :return: Returns a dictionary of labels with customised properties compatible with this command line interface.
+    """
+
+    extractor = ExtractorFacade.execute(repo_link)
+    if not extractor:
+        raise AuditError(f'{repo_link} repository host is not supported.')
+    try:
+        return await extractor.request_labels()
+    except (aiohttp.ClientError, asyncio.TimeoutError) as error:
+        raise AuditError(f'The labels of {repo_link} could not be retrieved. {type(error).__name__}: {error}')
+
+
+async def request_template_labels(template):
+    """
+    Returns the labels of the template which is either a json file path or a link to a template repository.
+    :param template: The json file path or the link to the template repository
+    :return: Returns a dictionary of labels with customised properties compatible with this command line interface.
+    """
+
+    if Path(template).is_file():
+        with open(template, mode='r') as json_file:
+            return normalize_labels(json.load(json_file))
+    return await request_link_labels(template)
+
+
+async def request_org_repo_links(org_link):
+    """
+    Returns the links to the repositories of the organisation such as https://github.com/lwhjon
+    :param org_link: The link to the organisation, group or user
+    :return: Returns the list of links to the repositories of the organisation.
+    """
+
+    extractor = ExtractorFacade.execute(org_link)
+    if not extractor:
+        raise AuditError(f'{org_link} organisation host is not supported.')
+    org_name = urlparse(org_link).path.strip('/')
+    # To consider organisation and group pages such as https://github.com/orgs/lwhjon
+    for org_path_prefix in ['orgs/', 'groups/']:
+        if org_name.startswith(org_path_prefix):
+            org_name = org_name[len(org_path_prefix):]
+    try:
+        org_repo_links = await extractor.request_org_repo_links(org_name)
+    except NotImplementedError:
+        raise AuditError(f'Listing the repositories of {org_link} is not supported.')
+    except (aiohttp.ClientError, asyncio.TimeoutError) as error:
+        raise AuditError(f'The repositories of {org_link} could not be retrieved. {type(error).__name__}: {error}')
+    # A mistyped organisation fails the audit instead of auditing no repositories.
+    if org_repo_links is None:
+        raise AuditError(f'{org_link} organisation was not found.')
+    return org_repo_links
+
+
+async def audit_repo(repo_link, template_labels):
+    """
+    Returns the AuditResult of the repository against the template labels.
+    :param repo_link: The link to the repository
+    :param template_labels: The dictionary of template labels
+    :return: Returns the AuditResult of the repository.
+    """
+
+    try:
+        repo_labels = await operation_tracker.track(f'Audit the labels of {repo_link}',
+                                                    partial(request_link_labels, repo_link))
+    except Exception as error:
+        # Any failure, such as an unexpected response, fails the audit of the repository instead of being reported
+        # as drift.
+        return AuditResult(repo_link, None, None, describe_error(error))
+
+    label_diff = diff_labels(template_labels, repo_labels)
+    mismatched_properties = {
+        current_label_name: diff_label_properties(template_labels[current_label_name], repo_labels[current_label_name])
+        for current_label_name in label_diff.mismatched
+    }
+    return AuditResult(repo_link, label_diff, mismatched_properties, None)
+
+
+async def request_audit(template, repo_links, org_links, concurrency):
+    # Every read request of the audit, including each page of the labels, shares the same concurrency limit.
+    limit_concurrent_requests(concurrency)
+    template_labels = await request_template_labels(template)
+
+    org_repo_links = await asyncio.gather(*[request_org_repo_links(org_link) for org_link in org_links])
+    # To remove duplicated repositories while preserving the order of the repositories.
+    all_repo_links = list(dict.fromkeys(
+        [*repo_links, *[repo_link for current_links in org_repo_links for repo_link in current_links]]))
+
+    return await asyncio.gather(*[audit_repo(repo_link, template_labels) for repo_link in all_repo_links])
+
+
+def format_audit_result(audit_result: AuditResult):
+    """
+    Returns the human readable report of the audit result of a repository.
+    :param audit_result: The AuditResult of the repository
+    :return: Returns the human readable report of the audit result.
+    """
+
+    if audit_result.error:
+        return f'{audit_result.repo_link}: {audit_result.error}'
+
+    label_diff = audit_result.label_diff
+    if not label_diff.has_drift:
+        return f'{audit_result.repo_link}: in sync with the template.'
+
+    response = f'{audit_result.repo_link}: {len(label_diff.missing)} missing, {len(label_diff.extra)} extra ' \
+               f'and {len(label_diff.mismatched)} mismatched labels.'
+    if label_diff.missing:
+        response = f"{response}\n    Missing: {', '.join(label_diff.missing)}"
+    if label_diff.extra:
+        response = f"{response}\n    Extra: {', '.join(label_diff.extra)}"
+    for current_label_name, properties in audit_result.mismatched_properties.items():
+        differences = ', '.join(f'{property_name} (template: {template_value!r}, repository: {repo_value!r})'
+                                for property_name, (template_value, repo_value) in properties.items())
+        response = f'{response}\n    Mismatched {current_label_name}: {differences}'
+    return response
+
+
+def gen_audit_report(template, audit_results, exit_code):
+    return {
+        'template': str(template),
+        'exit_code': int(exit_code),
+        'repositories': [
+            {
+                'repository': audit_result.repo_link,
+                'status': 'failed' if audit_result.error else
+                'drifted' if audit_result.label_diff.has_drift else 'in_sync',
+                'error': audit_result.error,
+                'missing': audit_result.label_diff.missing if audit_result.label_diff else None,
+                'extra': audit_result.label_diff.extra if audit_result.label_diff else None,
+                'mismatched': {
+                    current_label_name: {
+                        property_name: {'template': template_value, 'repository': repo_value}
+                        for property_name, (template_value, repo_value) in properties.items()
+                    } for current_label_name, properties in audit_result.mismatched_properties.items()
+                } if audit_result.mismatched_properties is not None else None,
+            } for audit_result in audit_results
+        ],
+    }
+
+
+def run_audit(template, repo_links, org_links=None, concurrency=DEFAULT_AUDIT_CONCURRENCY, report_file_path=None):
+    """
+    Audits the repositories and the repositories of the organisations against the template and reports the missing,
+    extra and mismatched labels of each repository.
+    :param template: The json file path or the link to the template repository
+    :param repo_links: The list of links to the repositories to be audited
+    :param org_links: The list of links to the organisations whose repositories are to be audited
+    :param concurrency: The max number of concurrent read requests
+    :param report_file_path: The json file path which the audit report will be written to
+    :return: Returns the AuditExitCodes which is IN_SYNC if all repositories are in sync with the template,
+    DRIFT_DETECTED if any repository has drifted and AUDIT_FAILED if any repository could not be audited.
+    """
+
+    try:
+        audit_results = run_async(request_audit(template, repo_links, org_links or [], max(1, concurrency)))
+    except AuditError as error:
+        logger.error(error.message)
+        return AuditExitCodes.AUDIT_FAILED
+    except (OSError, json.JSONDecodeError) as error:
+        logger.error(f'The template {template} could not be loaded. {type(error).__name__}: {error}')
+        return AuditExitCodes.AUDIT_FAILED
+    except Exception as error:
+        logger.error(f'The audit failed. {describe_error(error)}')
+        return AuditExitCodes.AUDIT_FAILED
+
+    for audit_result in audit_results:
+        logger.info(format_audit_result(audit_result))
+
+    record_label_counts({
+        audit_result.repo_link: sum(map(len, [audit_result.label_diff.extra, audit_result.label_diff.mismatched,
+                                              audit_result.label_diff.unchanged]))
+        for audit_result in audit_results if not audit_result.error
+    })
+
+    if any(audit_result.error for audit_result in audit_results):
+        exit_code = AuditExitCodes.AUDIT_FAILED
+    elif any(audit_result.label_diff.has_drift for audit_result in audit_results):
+        exit_code = AuditExitCodes.DRIFT_DETECTED
+    else:
+        exit_code = AuditExitCodes.IN_SYNC
+
+    num_of_drifted = sum(1 for audit_result in audit_results
+                         if not audit_result.error and audit_result.label_diff.has_drift)
+    num_of_failed = sum(1 for audit_result in audit_results if audit_result.error)
+    logger.info(f'Audited {len(audit_results)} repositories against {template}: '
+                f'{len(audit_results) - num_of_drifted - num_of_failed} in sync, {num_of_drifted} drifted '
+                f'and {num_of_failed} failed.')
+
+    if report_file_path:
+        report_file_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(report_file_path, mode='w') as json_file:
+            json.dump(gen_audit_report(template, audit_results, exit_code), json_file, indent=4)
+        logger.info(f'The audit report has been written to {report_file_path}')
+
+    return exit_code
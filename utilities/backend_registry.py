@@ -0,0 +1,101 @@
+"""
+This module contains the registry of the supported repository hosts and their backends.
+The extractor and importer of a backend are only imported when they are required by the current command.
+"""
+
+import importlib
+import logging
+import re
+
+from collections import namedtuple
+from functools import lru_cache
+from exceptions.general_exceptions import SiteNotSupported
+from utilities.config import REPOLABELS_HOSTS
+
+logger = logging.getLogger(__name__)
+
+Backend = namedtuple('Backend', ['name', 'extractor_path', 'importer_path', 'api_path'])
+HostConfiguration = namedtuple('HostConfiguration', ['hostname', 'backend', 'api_base_url', 'credentials_prefix'])
+
+BACKENDS = {
+    'github': Backend('github', 'extractors.github_extractor.GitHubExtractor',
+                      'importers.github_importer.GitHubImporter', '/api/v3'),
+    'gitlab': Backend('gitlab', 'extractors.gitlab_extractor.GitLabExtractor',
+                      'importers.gitlab_importer.GitLabImporter', '/api/v4'),
+    'gitea': Backend('gitea', 'extractors.gitea_extractor.GiteaExtractor',
+                     'importers.gitea_importer.GiteaImporter', '/api/v1'),
+}
+
+DEFAULT_HOSTS = {
+    'github.com': HostConfiguration('github.com', BACKENDS['github'], 'https://api.github.com', 'GITHUB'),
+    'www.github.com': HostConfiguration('www.github.com', BACKENDS['github'], 'https://api.github.com', 'GITHUB'),
+    'gitlab.com': HostConfiguration('gitlab.com', BACKENDS['gitlab'], 'https://gitlab.com/api/v4', 'GITLAB'),
+    'www.gitlab.com': HostConfiguration('www.gitlab.com', BACKENDS['gitlab'], 'https://gitlab.com/api/v4', 'GITLAB'),
+    'gitea.com': HostConfiguration('gitea.com', BACKENDS['gitea'], 'https://gitea.com/api/v1', 'GITEA'),
+}
+
+
+def parse_hosts(hosts_config):
+    """
+    Returns the host configurations parsed from a comma separated list of hostname=backend
+    or hostname=backend:CREDENTIALS, either optionally followed by @api_base_url, such as
+    github.example.com=github:GHE,gitlab.example.com=gitlab@https://gitlab.example.com/api/v4
+    If the API base url is not specified, it defaults to https://{hostname}{api_path} of the backend.
+    The credentials of the host are read from the {CREDENTIALS}_USERNAME and {CREDENTIALS}_PERSONAL_ACCESS_TOKEN
+    environment variables. If CREDENTIALS is not specified, it defaults to the uppercase hostname with every
+    character other than letters and digits replaced by _ such as GITHUB_EXAMPLE_COM.
+    :param hosts_config: The comma separated list of hosts
+    :return: Returns a dictionary of host configurations with the hostname as the key.
+    """
+
+    hosts = dict()
+    for host_entry in filter(None, (entry.strip() for entry in hosts_config.split(','))):
+        hostname, _, backend_entry = host_entry.partition('=')
+        backend_entry, _, api_base_url = backend_entry.partition('@')
+        backend_name, _, credentials_prefix = backend_entry.partition(':')
+        hostname, backend_name = hostname.strip().lower(), backend_name.strip().lower()
+        if not hostname or backend_name not in BACKENDS:
+            logger.error(f'Ignoring the host {host_entry} as the backend should be one of {", ".join(BACKENDS)}.')
+            continue
+        backend = BACKENDS[backend_name]
+        api_base_url = api_base_url.strip().rstrip('/') or f'https://{hostname}{backend.api_path}'
+        # The credentials of the default hosts are never sent to the configured hosts unless they are named.
+        credentials_prefix = credentials_prefix.strip() or re.sub('[^A-Z0-9]', '_', hostname.upper())
+        hosts[hostname] = HostConfiguration(hostname, backend, api_base_url, credentials_prefix)
+    return hosts
+
+
+@lru_cache(maxsize=None)
+def registered_hosts():
+    """
+    Returns the default hosts together with the hosts configured in REPOLABELS_HOSTS
+    which take precedence over the default hosts.
+    :return: Returns a dictionary of host configurations with the hostname as the key.
+    """
+
+    return {**DEFAULT_HOSTS, **parse_hosts(REPOLABELS_HOSTS)}
+
+
+def get_host_configuration(hostname):
+    """
+    Returns the host configuration of the hostname.
+    :param hostname: The hostname of the repository link
+    :return: Returns the host configuration of the hostname else it raises SiteNotSupported.
+    """
+
+    host_configuration = registered_hosts().get(hostname.lower()) if hostname else None
+    if not host_configuration:
+        raise SiteNotSupported(hostname)
+    return host_configuration
+
+
+@lru_cache(maxsize=None)
+def load_class(class_path):
+    """
+    Imports the module of the class on first use and returns the class.
+    :param class_path: The dotted path of the class such as extractors.github_extractor.GitHubExtractor
+    :return: Returns the class
+    """
+
+    module_path, _, class_name = class_path.rpartition('.')
+    return getattr(importlib.import_module(module_path), class_name)
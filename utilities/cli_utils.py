@@ -3,18 +3,21 @@ This module contains the command line interface (cli) utility methods
 """
 
 import asyncio
-import aiohttp
 import logging
-import os
 import webbrowser
 import validators
 
+from datetime import datetime
 from pathlib import Path
 from utilities.extractor_facade import ExtractorFacade
+from utilities.http_traffic import client_session
 from utilities.importer_facade import ImporterFacade
+from utilities.run_control import run_async
 from urllib.parse import urlparse
 
 DEFAULT_SERVICES = ['https://github.com']
+# The number of seconds between the refreshes of the rate limits when they are watched
+DEFAULT_WATCH_INTERVAL = 10
 
 logger = logging.getLogger(__name__)
 
@@ -74,20 +77,84 @@ async def request_rate_limits(services):
     return rate_limit_results
 
 
-def rate_limits(services=None):
-    if services is None:
+async def request_rate_limit_resources(services):
+    tasks = []
+    for service in services:
+        service_object = ExtractorFacade().execute(service)
+        tasks.append(asyncio.ensure_future(service_object.get_rate_limit_resources()))
+
+    return await asyncio.gather(*tasks)
+
+
+def format_rate_limit_resources(service_name, resources, previous_resources=None):
+    """
+    Returns the table of the rate limit of each resource of the service.
+    :param service_name: The service name
+    :param resources: The dictionary of the resource names to their RateLimit
+    :param previous_resources: The dictionary of the resource names to their RateLimit of the previous refresh
+    :return: Returns the table of the rate limit of each resource.
+    """
+
+    previous_resources = previous_resources or dict()
+    rows = [('Resource', 'Limit', 'Remaining', 'Used', 'Used since last refresh', 'Resets at')]
+    for resource_name, rate_limit in resources.items():
+        previous_rate_limit = previous_resources.get(resource_name)
+        # The usage since the last refresh is only known if the rate limit has not been reset since then.
+        used_since_last_refresh = rate_limit.used - previous_rate_limit.used \
+            if previous_rate_limit and previous_rate_limit.reset_time == rate_limit.reset_time else '-'
+        rows.append((resource_name, rate_limit.limit, rate_limit.remaining, rate_limit.used, used_since_last_refresh,
+                     rate_limit.reset_time))
+    column_widths = [max(len(str(row[column])) for row in rows) for column in range(len(rows[0]))]
+    header = f'{service_name} Rate Limits Information'
+    table = '\n'.join('  '.join(str(value).ljust(width) for value, width in zip(row, column_widths)).rstrip()
+                      for row in rows)
+    return f"\n\n{header}\n{'=' * len(header)}\n{table}\n"
+
+
+async def watch_rate_limits(services, interval):
+    previous_results = dict()
+    while True:
+        for service, (service_name, resources) in zip(services, await request_rate_limit_resources(services)):
+            if not resources:
+                logger.info(f'{service_name} does not enforce API rate limits.')
+                continue
+            logger.info(f'Rate Limits Information at {datetime.now().replace(microsecond=0)}: '
+                        f'{format_rate_limit_resources(service_name, resources, previous_results.get(service))}')
+            previous_results[service] = resources
+        await asyncio.sleep(interval)
+
+
+def rate_limits(services=None, watch=False, interval=DEFAULT_WATCH_INTERVAL):
+    """
+    Logs the rate limit information of the services.
+    :param services: The list of links to the services (default: https://github.com)
+    :param watch: Logs the rate limit of every resource of the services every interval until the command is
+    interrupted or exceeds its deadline
+    :param interval: The number of seconds between the refreshes when watching
+    """
+
+    if not services:
         services = DEFAULT_SERVICES
+    # The unsupported services are skipped as their SiteNotSupported error is logged by the ExtractorFacade.
+    services = [service for service in services if ExtractorFacade().execute(service)]
+    if not services:
+        return
+
+    if watch:
+        # Interrupting is the usual way to stop watching, hence it is not reported as an error.
+        try:
+            run_async(watch_rate_limits(services, max(1, interval)), handle_interrupt=False)
+        except KeyboardInterrupt:
+            logger.info('Stopped watching the rate limits.')
+        return
 
-    # Workaround for known issue involving event loop for Windows environment:
-    # Resources:
-    # https://github.com/aio-libs/aiohttp/issues/4536#issuecomment-698441077
-    # https://bugs.python.org/issue39232 (Known issue in Python)
-    if os.name == "nt":
-        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
-    results = asyncio.run(request_rate_limits(services))
+    results = run_async(request_rate_limits(services))
 
     for current_result in results:
         service_name, total_rate_limit, rate_limit_remaining, rate_limit_used, rate_limit_reset_time = current_result
+        if total_rate_limit is None:
+            logger.info(f'{service_name} does not enforce API rate limits.')
+            continue
         header = f'{service_name} Rate Limits Information'
         response = f"\n\n{header}\n" \
                    f"{'=' * len(header)}\n" \
@@ -98,17 +165,18 @@ def rate_limits(services=None):
         logger.info(f'Rate Limits Information: {response}')
 
 
-def validate_url(url):
+def validate_url(url, exit_code=1):
     """
-    To check if the input url is valid else an error will be outputted and the program exits with exit code 1.
+    To check if the input url is valid else an error will be outputted and the program exits with the exit code.
     :param url: The input url to be validated.
+    :param exit_code: The exit code of the program if the input url is not valid (default: 1)
     :return: Returns True if the input url is a valid url else it will raise an error
-    and the program exits with exit code 1.
+    and the program exits with the exit code.
     """
 
     if not validators.url(format_url(url)):
         logger.error(f'Please ensure that {url} is a valid url.')
-        raise SystemExit(1)
+        raise SystemExit(exit_code)
 
     return True
 
@@ -119,10 +187,10 @@ async def request_latest_version(github_repo_url):
     :param github_repo_url The RepoLabels GitHub Project Repository url
     :return: Returns the Latest Stable Release Version from RepoLabels GitHub Repository
     """
-    async with aiohttp.ClientSession() as session:
+    async with client_session() as session:
         async with session.get(f'{github_repo_url}/releases/latest', allow_redirects=False) as response:
             location_header = str(response.headers.get('Location'))
-            logger.debug(response.headers)
+            logger.debug('%s', response.headers)
 
             # Parse latest version from response
             location_header = urlparse(location_header).path.split('/')
@@ -136,12 +204,6 @@ def check_updates(github_repo_url):
     :param github_repo_url The RepoLabels GitHub Project Repository url
     :return: Returns the Latest Stable Release Version from RepoLabels GitHub Repository.
     """
-    # Workaround for known issue involving event loop for Windows environment:
-    # Resources:
-    # https://github.com/aio-libs/aiohttp/issues/4536#issuecomment-698441077
-    # https://bugs.python.org/issue39232 (Known issue in Python)
-    if os.name == "nt":
-        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
-    latest_version = asyncio.run(request_latest_version(github_repo_url))
-    logger.debug(f'RepoLabels command line interface Latest Stable Version: {latest_version}')
+    latest_version = run_async(request_latest_version(github_repo_url))
+    logger.debug('RepoLabels command line interface Latest Stable Version: %s', latest_version)
     return latest_version
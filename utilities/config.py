@@ -4,10 +4,26 @@ This module handles environmental variables
 
 import os
 
+from collections import namedtuple
 from dotenv import load_dotenv
 
 load_dotenv()
 
-# GitHub credentials
-GITHUB_USERNAME = os.getenv('GITHUB_USERNAME')
-GITHUB_PERSONAL_ACCESS_TOKEN = os.getenv('GITHUB_PERSONAL_ACCESS_TOKEN')
+Credentials = namedtuple('Credentials', ['username', 'personal_access_token'])
+
+# Additional repository hosts such as GitHub Enterprise, self-hosted GitLab and Gitea instances.
+# A comma separated list of hostname=backend, hostname=backend:CREDENTIALS or either followed by @api_base_url
+REPOLABELS_HOSTS = os.getenv('REPOLABELS_HOSTS', '')
+
+
+def get_credentials(credentials_prefix):
+    """
+    Returns the credentials of a repository host from the {credentials_prefix}_USERNAME and
+    {credentials_prefix}_PERSONAL_ACCESS_TOKEN environment variables such as GITHUB_USERNAME and
+    GITHUB_PERSONAL_ACCESS_TOKEN, hence each host is only sent its own credentials.
+    :param credentials_prefix: The prefix of the environment variables of the credentials such as GITHUB
+    :return: Returns the Credentials whose username and personal access token are None if they are not configured.
+    """
+
+    return Credentials(os.getenv(f'{credentials_prefix}_USERNAME'),
+                       os.getenv(f'{credentials_prefix}_PERSONAL_ACCESS_TOKEN'))
@@ -1,6 +1,30 @@
-from enum import Enum
+from enum import Enum, IntEnum
 
 
 class ImportModes(Enum):
     IMPORT_LABELS = 'IMPORT'
     DEL_ALL_LABELS = 'DEL_ALL_LABELS'
+
+
+class TrafficModes(Enum):
+    LIVE = 'LIVE'
+    RECORD = 'RECORD'
+    REPLAY = 'REPLAY'
+
+
+class AuditExitCodes(IntEnum):
+    IN_SYNC = 0
+    DRIFT_DETECTED = 1
+    AUDIT_FAILED = 2
+
+
+class OperationStatus(Enum):
+    PENDING = 'PENDING'
+    COMPLETED = 'COMPLETED'
+    FAILED = 'FAILED'
+
+
+class EstimateCommands(Enum):
+    SYNC = 'sync'
+    IMPORT = 'import'
+    RM_ALL = 'rm-all'
@@ -0,0 +1,242 @@
+"""
+This module contains the estimate of the API calls of a planned sync, import or rm-all subcommand over a number of
+repositories and the projection of its completion time under the remaining API rate limit.
+The number of labels of each repository is taken from the label counts cache, hence only the repositories which are
+not cached are requested. The estimate never modifies any repository.
+"""
+
+import asyncio
+import json
+import logging
+import math
+
+import aiohttp
+
+from collections import namedtuple
+from datetime import datetime, timedelta
+from exceptions.general_exceptions import EstimateError
+from utilities.constants import EstimateCommands
+from utilities.extractor_facade import ExtractorFacade
+from utilities.label_counts import load_label_counts, record_label_counts
+from utilities.run_control import run_async
+
+# The number of repositories whose number of labels are requested concurrently.
+DEFAULT_ESTIMATE_CONCURRENCY = 5
+
+logger = logging.getLogger(__name__)
+
+ApiCalls = namedtuple('ApiCalls', ['repo_link', 'num_of_labels', 'num_of_reads', 'min_num_of_writes',
+                                   'max_num_of_writes'])
+ServiceEstimate = namedtuple('ServiceEstimate', ['service_name', 'api_calls', 'rate_limit', 'completion_time'])
+
+
+def num_of_pages(num_of_labels, per_page):
+    # The first page is requested even if the repository does not have any labels.
+    return max(1, math.ceil(num_of_labels / per_page))
+
+
+def estimate_write_calls(num_of_desired_labels, num_of_labels):
+    """
+    Returns the min and max number of label write requests to import the desired labels to a repository.
+    Only the number of labels is known, hence at least the difference in the number of labels is created or deleted
+    and at most every desired label is created and every existing label is deleted.
+    :param num_of_desired_labels: The number of desired labels
+    :param num_of_labels: The number of existing labels of the repository
+    :return: Returns the min and max number of label write requests.
+    """
+
+    return abs(num_of_desired_labels - num_of_labels), num_of_desired_labels + num_of_labels
+
+
+def estimate_command_calls(command: EstimateCommands, repo_link, num_of_labels, per_page, num_of_desired_labels=0,
+                           cache_ttl=0):
+    """
+    Returns the API calls of the command on the repository based on the same requests as the command sends.
+    :param command: The planned command
+    :param repo_link: The link to the repository which the labels are imported to or deleted from
+    :param num_of_labels: The number of existing labels of the repository
+    :param per_page: The max number of labels per page of the backend API
+    :param num_of_desired_labels: The number of labels of the json file or the source repository
+    :param cache_ttl: The number of seconds the retrieved labels are cached for within the run
+    :return: Returns the ApiCalls of the command on the repository.
+    """
+
+    if command == EstimateCommands.RM_ALL:
+        # The labels are retrieved again before they are deleted unless the retrieved labels are cached.
+        num_of_reads = num_of_pages(num_of_labels, per_page) * (2 if num_of_labels and not cache_ttl else 1)
+        return ApiCalls(repo_link, num_of_labels, num_of_reads, num_of_labels, num_of_labels)
+
+    # The labels are not imported at all if there are no desired labels.
+    if not num_of_desired_labels:
+        return ApiCalls(repo_link, num_of_labels, 0, 0, 0)
+    return ApiCalls(repo_link, num_of_labels, num_of_pages(num_of_labels, per_page),
+                    *estimate_write_calls(num_of_desired_labels, num_of_labels))
+
+
+def label_cache_ttl(extractor, cache_ttl):
+    # The retrieved labels are only cached within the run by the backends which request them through label_requests.
+    return cache_ttl if extractor.caches_label_requests else 0
+
+
+def project_completion_time(num_of_calls, rate_limit, rate_limit_window, now):
+    """
+    Returns the earliest time which the API calls can complete by under the rate limit.
+    The calls beyond the remaining rate limit have to wait for the rate limit to reset, once for each rate limit
+    window they span.
+    :param num_of_calls: The number of API calls
+    :param rate_limit: The RateLimit of the service, None if the service does not enforce rate limits
+    :param rate_limit_window: The number of seconds after which the rate limit is replenished
+    :param now: The current time
+    :return: Returns the earliest completion time, now if the calls fit within the remaining rate limit and None if
+    they can never complete such as a rate limit of 0.
+    """
+
+    if rate_limit is None or num_of_calls <= rate_limit.remaining:
+        return now
+    if rate_limit.limit <= 0:
+        return None
+    num_of_windows = math.ceil((num_of_calls - rate_limit.remaining) / rate_limit.limit)
+    return max(rate_limit.reset_time, now) + timedelta(seconds=(rate_limit_window or 0) * (num_of_windows - 1))
+
+
+def get_extractor(repo_link):
+    extractor = ExtractorFacade.execute(repo_link)
+    if not extractor:
+        raise EstimateError(f'{repo_link} repository host is not supported.')
+    return extractor
+
+
+async def request_num_of_labels(extractor, semaphore):
+    try:
+        async with semaphore:
+            return await extractor.request_num_of_labels()
+    except (aiohttp.ClientError, asyncio.TimeoutError) as error:
+        raise EstimateError(f'The number of labels of {extractor.link} could not be retrieved. '
+                            f'{type(error).__name__}: {error}')
+
+
+async def request_rate_limit_resources(extractor):
+    try:
+        return await extractor.get_rate_limit_resources()
+    except (aiohttp.ClientError, asyncio.TimeoutError) as error:
+        raise EstimateError(f'The rate limits of {extractor.api_base_url} could not be retrieved. '
+                            f'{type(error).__name__}: {error}')
+
+
+async def request_estimate(command: EstimateCommands, src, repo_links, refresh=False, cache_ttl=0):
+    num_of_desired_labels = 0
+    if command == EstimateCommands.IMPORT:
+        with open(src, mode='r') as json_file:
+            num_of_desired_labels = len(json.load(json_file))
+
+    extractors = {repo_link: get_extractor(repo_link)
+                  for repo_link in ([src, *repo_links] if command == EstimateCommands.SYNC else repo_links)}
+
+    # Optimisation: Only the repositories which are not cached are requested, a single API call each.
+    label_counts = {} if refresh else load_label_counts()
+    uncached_repo_links = [repo_link for repo_link in extractors if repo_link not in label_counts]
+    semaphore = asyncio.Semaphore(DEFAULT_ESTIMATE_CONCURRENCY)
+    requested_counts = dict(zip(uncached_repo_links, await asyncio.gather(
+        *[request_num_of_labels(extractors[repo_link], semaphore) for repo_link in uncached_repo_links])))
+    record_label_counts(requested_counts)
+    num_of_labels = {repo_link: requested_counts[repo_link] if repo_link in requested_counts
+                     else label_counts[repo_link]['num_of_labels'] for repo_link in extractors}
+
+    api_calls = []
+    if command == EstimateCommands.SYNC:
+        src_extractor = extractors[src]
+        num_of_desired_labels = num_of_labels[src]
+        # Each destination repository is synchronised by a separate sync command which retrieves the source labels.
+        api_calls.append(ApiCalls(src, num_of_desired_labels,
+                                  num_of_pages(num_of_desired_labels, src_extractor.per_page) * len(repo_links), 0, 0))
+    api_calls.extend(estimate_command_calls(command, repo_link, num_of_labels[repo_link],
+                                            extractors[repo_link].per_page, num_of_desired_labels,
+                                            label_cache_ttl(extractors[repo_link], cache_ttl))
+                     for repo_link in repo_links)
+
+    # The API calls are grouped by service as each service has its own rate limit.
+    services = dict()
+    for current_api_calls in api_calls:
+        extractor = extractors[current_api_calls.repo_link]
+        services.setdefault(extractor.api_base_url, (extractor, []))[1].append(current_api_calls)
+
+    rate_limit_results = await asyncio.gather(*[request_rate_limit_resources(extractor)
+                                                for extractor, _ in services.values()])
+    now = datetime.now()
+    service_estimates = []
+    for (extractor, service_api_calls), (service_name, resources) in zip(services.values(), rate_limit_results):
+        # The label requests are counted against the core rate limit.
+        rate_limit = resources.get('core')
+        num_of_calls = sum(calls.num_of_reads + calls.max_num_of_writes for calls in service_api_calls)
+        service_estimates.append(ServiceEstimate(
+            f'{service_name} ({extractor.api_base_url})', service_api_calls, rate_limit,
+            project_completion_time(num_of_calls, rate_limit, extractor.rate_limit_window, now)))
+    return len(requested_counts), service_estimates
+
+
+def format_write_calls(min_num_of_writes, max_num_of_writes):
+    if min_num_of_writes == max_num_of_writes:
+        return f'{max_num_of_writes}'
+    return f'{min_num_of_writes} to {max_num_of_writes}'
+
+
+def format_service_estimate(service_estimate: ServiceEstimate, now):
+    """
+    Returns the human readable estimate of the API calls of a service and its projected completion time.
+    :param service_estimate: The ServiceEstimate of the service
+    :param now: The current time
+    :return: Returns the human readable estimate of the service.
+    """
+
+    api_calls = service_estimate.api_calls
+    num_of_reads = sum(calls.num_of_reads for calls in api_calls)
+    min_num_of_writes = sum(calls.min_num_of_writes for calls in api_calls)
+    max_num_of_writes = sum(calls.max_num_of_writes for calls in api_calls)
+    num_of_calls = num_of_reads + max_num_of_writes
+    response = f'{service_estimate.service_name}: {num_of_reads} reads and ' \
+               f'{format_write_calls(min_num_of_writes, max_num_of_writes)} writes, {num_of_calls} API calls at most.'
+    for calls in api_calls:
+        response = f'{response}\n    {calls.repo_link} ({calls.num_of_labels} labels): {calls.num_of_reads} reads ' \
+                   f'and {format_write_calls(calls.min_num_of_writes, calls.max_num_of_writes)} writes'
+
+    rate_limit = service_estimate.rate_limit
+    if rate_limit is None:
+        return f'{response}\nThe service does not enforce API rate limits.'
+    response = f'{response}\nRemaining rate limit: {rate_limit.remaining} of {rate_limit.limit}, ' \
+               f'resets at {rate_limit.reset_time}'
+    if service_estimate.completion_time is None:
+        return f'{response}\nThe command cannot complete under a rate limit of {rate_limit.limit}.'
+    if service_estimate.completion_time <= now:
+        return f'{response}\nThe command fits within the remaining rate limit.'
+    return f'{response}\nThe command exceeds the remaining rate limit by {num_of_calls - rate_limit.remaining} ' \
+           f'API calls and is projected to complete at {service_estimate.completion_time} at the earliest.'
+
+
+def run_estimate(command: EstimateCommands, src, repo_links, refresh=False, cache_ttl=0):
+    """
+    Estimates the API calls of the planned command over the repositories and projects its completion time under
+    the remaining rate limit of each service.
+    :param command: The planned command
+    :param src: The link to the source repository of the sync command or the json file path of the import command
+    :param repo_links: The list of links to the repositories which the labels are imported to or deleted from
+    :param refresh: Requests the number of labels of every repository instead of using the cached label counts
+    :param cache_ttl: The number of seconds the retrieved labels are cached for within the planned command
+    :return: Returns the exit code which is 0 if the estimate succeeded and 1 if it failed.
+    """
+
+    try:
+        num_of_requested_counts, service_estimates = run_async(
+            request_estimate(command, src, repo_links, refresh, cache_ttl))
+    except EstimateError as error:
+        logger.error(error.message)
+        return 1
+    except (OSError, json.JSONDecodeError) as error:
+        logger.error(f'The json file {src} could not be loaded. {type(error).__name__}: {error}')
+        return 1
+
+    now = datetime.now()
+    logger.info(f'Estimate of {command.value} over {len(repo_links)} repositories '
+                f'({num_of_requested_counts} label counts requested, the rest from the cache):')
+    for service_estimate in service_estimates:
+        logger.info(format_service_estimate(service_estimate, now))
+    return 0
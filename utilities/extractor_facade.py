@@ -7,7 +7,8 @@ import logging
 
 from urllib.parse import urlparse
 from exceptions.general_exceptions import SiteNotSupported
-from extractors.github_extractor import GitHubExtractor
+from utilities.backend_registry import get_host_configuration, load_class
+from utilities.config import get_credentials
 
 logger = logging.getLogger(__name__)
 
@@ -21,10 +22,10 @@ class ExtractorFacade:
             parsed_url = urlparse(current_repo_link)
             hostname = parsed_url.hostname
 
-            if hostname and hostname in ['www.github.com', 'github.com']:
-                return GitHubExtractor(current_repo_link)
-            else:
-                raise SiteNotSupported(hostname)
+            host_configuration = get_host_configuration(hostname)
+            extractor_class = load_class(host_configuration.backend.extractor_path)
+            return extractor_class(current_repo_link, host_configuration.api_base_url,
+                                   get_credentials(host_configuration.credentials_prefix))
         except SiteNotSupported as error:
             logger.error(error.message)
         return None
@@ -0,0 +1,341 @@
+"""
+This module contains the HTTP session factory used by the extractors and importers.
+Depending on the traffic mode, the sessions exchange requests with the live services, record every exchange
+to a directory or replay the recorded exchanges so that real runs can be profiled and regression tested offline.
+"""
+
+import asyncio
+import contextvars
+import itertools
+import json
+import logging
+import time
+
+import aiohttp
+
+from collections import defaultdict, deque
+from contextlib import asynccontextmanager
+from pathlib import Path
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+from exceptions.general_exceptions import RecordedExchangeNotFound
+from utilities.constants import TrafficModes
+
+logger = logging.getLogger(__name__)
+
+# The number of seconds each request has to complete within by default
+DEFAULT_REQUEST_TIMEOUT = 30
+
+_traffic_mode = TrafficModes.LIVE
+_traffic_recorder = None
+_traffic_replayer = None
+_request_timeout = DEFAULT_REQUEST_TIMEOUT
+# The semaphore which bounds the number of concurrent requests of the sessions created within the current context.
+_request_semaphore = contextvars.ContextVar('request_semaphore', default=None)
+# The session shared by the requests of each event loop which are not owned by a single caller.
+_shared_sessions = dict()
+
+
+def exchange_key(method, url, params=None, json_body=None):
+    """
+    Returns the key which identifies a request regardless of the order of its query parameters.
+    :param method: The HTTP method of the request
+    :param url: The url of the request which may already contain query parameters
+    :param params: The additional query parameters of the request
+    :param json_body: The json body of the request
+    :return: Returns the key which identifies the request
+    """
+
+    request_url = URL(str(url))
+    query = list(request_url.query.items())
+    if params:
+        query.extend((str(key), str(value)) for key, value in params.items())
+    request_url = request_url.with_query(sorted(query))
+    body = json.dumps(json_body, sort_keys=True) if json_body is not None else ''
+    return f'{method.upper()} {request_url} {body}'.strip()
+
+
+class TrafficRecorder:
+    """
+    Writes every exchanged request and response to a separate json file in the record directory.
+    """
+
+    def __init__(self, record_directory: Path):
+        self.record_directory = Path(record_directory)
+        self.record_directory.mkdir(parents=True, exist_ok=True)
+        self.start_time = time.perf_counter()
+        self.sequence = itertools.count(1)
+
+    async def record(self, method, url, params, json_body, started_at, elapsed, response, body):
+        exchange = {
+            'method': method.upper(),
+            'url': str(url),
+            'params': {str(key): str(value) for key, value in params.items()} if params else None,
+            'request_json': json_body,
+            'key': exchange_key(method, url, params, json_body),
+            'started_at': started_at - self.start_time,
+            'elapsed': elapsed,
+            'status': response.status,
+            'headers': list(response.headers.items()),
+            'links': {str(rel): str(link.get('url')) for rel, link in response.links.items()},
+            'body': body.decode('utf-8', errors='replace'),
+        }
+        exchange_file_path = self.record_directory.joinpath(f'{next(self.sequence):05d}_{method.lower()}.json')
+        # The file is written by a worker thread, hence recording does not block the event loop.
+        await asyncio.to_thread(exchange_file_path.write_text, json.dumps(exchange, indent=4), encoding='utf-8')
+        logger.debug('Recorded %s in %s', exchange['key'], exchange_file_path)
+
+
+class TrafficReplayer:
+    """
+    Serves the exchanges recorded in the replay directory. Identical requests are served in their recorded order,
+    and the last recorded exchange is served again once all of them have been served.
+    The original timings are reproduced: a request which is sent earlier than its recorded offset from the start of
+    the run is held back until that offset, and its response is served after the recorded response time.
+    Both are multiplied by the time scale, a time scale of 0 replays without any delay.
+    """
+
+    def __init__(self, replay_directory: Path, time_scale=1.0):
+        self.replay_directory = Path(replay_directory)
+        self.time_scale = time_scale
+        self.start_time = time.perf_counter()
+        self.exchanges = defaultdict(deque)
+        for exchange_file_path in sorted(self.replay_directory.glob('*.json')):
+            exchange = json.loads(exchange_file_path.read_text(encoding='utf-8'))
+            self.exchanges[exchange['key']].append(exchange)
+        logger.debug('Loaded %d recorded exchanges from %s', sum(map(len, self.exchanges.values())),
+                     self.replay_directory)
+
+    def find_exchange(self, method, url, params=None, json_body=None):
+        key = exchange_key(method, url, params, json_body)
+        recorded_exchanges = self.exchanges.get(key)
+        if not recorded_exchanges:
+            raise RecordedExchangeNotFound(key)
+        return recorded_exchanges.popleft() if len(recorded_exchanges) > 1 else recorded_exchanges[0]
+
+    def offset_delay(self, exchange):
+        """
+        Returns the number of seconds until the recorded offset of the exchange from the start of the run.
+        :param exchange: The recorded exchange
+        :return: Returns the number of seconds until the scaled recorded offset, 0 if it has already passed.
+        """
+
+        started_at = exchange.get('started_at') or 0
+        return max(0.0, self.start_time + started_at * self.time_scale - time.perf_counter())
+
+
+class ReplayResponse:
+    """
+    A response served from a recorded exchange which provides the subset of the aiohttp.ClientResponse
+    interface used by this command line interface.
+    """
+
+    def __init__(self, exchange):
+        self.method = exchange['method']
+        self.url = URL(exchange['url'])
+        self.status = exchange['status']
+        self.headers = CIMultiDictProxy(CIMultiDict(exchange['headers']))
+        self.links = {rel: {'rel': rel, 'url': URL(link)} for rel, link in exchange['links'].items()}
+        # aiohttp.ClientResponseError requires the complete request information, such as when raise_for_status
+        # is called on a recorded error response.
+        self.request_info = aiohttp.RequestInfo(self.url, self.method, CIMultiDictProxy(CIMultiDict()), self.url)
+        self._body = exchange['body']
+
+    async def read(self):
+        return self._body.encode('utf-8')
+
+    async def text(self):
+        return self._body
+
+    async def json(self, **kwargs):
+        return json.loads(self._body) if self._body else None
+
+    @property
+    def ok(self):
+        return self.status < 400
+
+    def raise_for_status(self):
+        if not self.ok:
+            raise aiohttp.ClientResponseError(self.request_info, (), status=self.status)
+
+    def release(self):
+        pass
+
+
+class _TrafficSession:
+    """
+    The common request interface of the recording and replaying sessions.
+    """
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        pass
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request('POST', url, **kwargs)
+
+    def put(self, url, **kwargs):
+        return self.request('PUT', url, **kwargs)
+
+    def patch(self, url, **kwargs):
+        return self.request('PATCH', url, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self.request('DELETE', url, **kwargs)
+
+    def request(self, method, url, **kwargs):
+        raise NotImplementedError
+
+
+class RecordingSession(_TrafficSession):
+
+    def __init__(self, recorder: TrafficRecorder, **session_kwargs):
+        self.recorder = recorder
+        self.session = aiohttp.ClientSession(**session_kwargs)
+
+    async def close(self):
+        await self.session.close()
+
+    @asynccontextmanager
+    async def request(self, method, url, **kwargs):
+        started_at = time.perf_counter()
+        async with self.session.request(method, url, **kwargs) as response:
+            # The body is read upfront so that the response time includes the transfer of the body.
+            # aiohttp keeps the body hence it can still be read by the caller.
+            body = await response.read()
+            elapsed = time.perf_counter() - started_at
+            await self.recorder.record(method, url, kwargs.get('params'), kwargs.get('json'), started_at, elapsed,
+                                       response, body)
+            yield response
+
+
+class ReplaySession(_TrafficSession):
+
+    def __init__(self, replayer: TrafficReplayer, **session_kwargs):
+        self.replayer = replayer
+        self.timeout = session_kwargs.get('timeout')
+
+    @asynccontextmanager
+    async def request(self, method, url, **kwargs):
+        exchange = self.replayer.find_exchange(method, url, kwargs.get('params'), kwargs.get('json'))
+        offset_delay = self.replayer.offset_delay(exchange)
+        if offset_delay > 0:
+            await asyncio.sleep(offset_delay)
+        delay = exchange['elapsed'] * self.replayer.time_scale
+        timeout = kwargs.get('timeout', self.timeout)
+        # The request timeout applies to the replayed response time as it would to the live response time.
+        if timeout and timeout.total and delay > timeout.total:
+            await asyncio.sleep(timeout.total)
+            raise asyncio.TimeoutError
+        if delay > 0:
+            await asyncio.sleep(delay)
+        yield ReplayResponse(exchange)
+
+
+class BoundedSession(_TrafficSession):
+    """
+    Sends the requests through the wrapped session while holding the semaphore, hence the number of requests in
+    flight is bounded across every session which shares the semaphore.
+    """
+
+    def __init__(self, session, semaphore: asyncio.Semaphore):
+        self.session = session
+        self.semaphore = semaphore
+
+    async def close(self):
+        await self.session.close()
+
+    @asynccontextmanager
+    async def request(self, method, url, **kwargs):
+        async with self.semaphore:
+            async with self.session.request(method, url, **kwargs) as response:
+                yield response
+
+
+def limit_concurrent_requests(max_concurrent_requests):
+    """
+    Bounds the number of concurrent requests of the sessions created by client_session within the current context,
+    such as the current task and the tasks it creates afterwards.
+    :param max_concurrent_requests: The max number of concurrent requests
+    """
+
+    _request_semaphore.set(asyncio.Semaphore(max_concurrent_requests))
+
+
+def configure_traffic(mode: TrafficModes, directory: Path = None, time_scale=1.0):
+    """
+    Configures how the sessions created by client_session exchange their requests.
+    :param mode: The traffic mode
+    :param directory: The directory which the exchanges are recorded to or replayed from
+    :param time_scale: The multiplier applied to the original response times when replaying
+    """
+
+    global _traffic_mode, _traffic_recorder, _traffic_replayer
+
+    _traffic_mode = mode
+    _traffic_recorder = TrafficRecorder(directory) if mode == TrafficModes.RECORD else None
+    _traffic_replayer = TrafficReplayer(directory, time_scale) if mode == TrafficModes.REPLAY else None
+
+
+def configure_request_timeout(request_timeout):
+    """
+    Configures the number of seconds each request of the sessions created by client_session has to complete within.
+    :param request_timeout: The number of seconds each request has to complete within, 0 or None disables the timeout.
+    """
+
+    global _request_timeout
+
+    _request_timeout = request_timeout if request_timeout and request_timeout > 0 else None
+
+
+def client_session(**session_kwargs):
+    """
+    Returns the session based on the configured traffic mode. The session supports the same usage as
+    aiohttp.ClientSession such as async with client_session(headers=api_headers) as session
+    :param session_kwargs: The keyword arguments of aiohttp.ClientSession
+    :return: Returns the session based on the configured traffic mode.
+    """
+
+    if _request_timeout and 'timeout' not in session_kwargs:
+        session_kwargs['timeout'] = aiohttp.ClientTimeout(total=_request_timeout)
+    if _traffic_mode == TrafficModes.RECORD:
+        session = RecordingSession(_traffic_recorder, **session_kwargs)
+    elif _traffic_mode == TrafficModes.REPLAY:
+        session = ReplaySession(_traffic_replayer, **session_kwargs)
+    else:
+        session = aiohttp.ClientSession(**session_kwargs)
+    semaphore = _request_semaphore.get()
+    return BoundedSession(session, semaphore) if semaphore else session
+
+
+def shared_client_session():
+    """
+    Returns the session shared by the requests of the running event loop, such as the coalesced requests which are
+    shared by several callers, hence the connections are reused across the requests. The session is not owned by any
+    caller, hence it is not closed when a caller is cancelled, it is closed by close_shared_client_session.
+    The headers and authentication are passed with each request as the session is shared by different services.
+    :return: Returns the session shared by the requests of the running event loop.
+    """
+
+    loop = asyncio.get_running_loop()
+    if loop not in _shared_sessions:
+        _shared_sessions[loop] = client_session()
+    return _shared_sessions[loop]
+
+
+async def close_shared_client_session():
+    """
+    Closes the session shared by the requests of the running event loop if it has been created.
+    """
+
+    session = _shared_sessions.pop(asyncio.get_running_loop(), None)
+    if session:
+        await session.close()
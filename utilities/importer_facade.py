@@ -7,7 +7,8 @@ import logging
 
 from urllib.parse import urlparse
 from exceptions.general_exceptions import SiteNotSupported
-from importers.github_importer import GitHubImporter
+from utilities.backend_registry import get_host_configuration, load_class
+from utilities.config import get_credentials
 
 logger = logging.getLogger(__name__)
 
@@ -21,10 +22,10 @@ class ImporterFacade:
             parsed_url = urlparse(current_repo_link)
             hostname = parsed_url.hostname
 
-            if hostname and hostname in ['www.github.com', 'github.com']:
-                return GitHubImporter(current_repo_link, loaded_json_data)
-            else:
-                raise SiteNotSupported(hostname)
+            host_configuration = get_host_configuration(hostname)
+            importer_class = load_class(host_configuration.backend.importer_path)
+            return importer_class(current_repo_link, loaded_json_data, host_configuration.api_base_url,
+                                  get_credentials(host_configuration.credentials_prefix))
         except SiteNotSupported as error:
             logger.error(error.message)
         return None
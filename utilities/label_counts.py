@@ -0,0 +1,85 @@
+"""
+This module contains the cache of the number of labels of the repositories whose labels have been retrieved.
+The cached label counts are used by the estimate subcommand to predict the API calls of a planned command
+without retrieving the labels again.
+"""
+
+import json
+import logging
+
+from datetime import datetime
+from pathlib import Path
+
+LABEL_COUNTS_FILE_PATH = Path.cwd().joinpath('cache', 'label_counts.json')
+
+logger = logging.getLogger(__name__)
+
+
+def load_label_counts(file_path: Path = None):
+    """
+    Returns the cached label counts of the repositories.
+    :param file_path: The json file path of the cache (default: cache/label_counts.json)
+    :return: Returns a dictionary of the repository links to their number of labels and the time which the labels
+    were retrieved, an empty dictionary if there is no cache.
+    """
+
+    file_path = file_path or LABEL_COUNTS_FILE_PATH
+    try:
+        with open(file_path, mode='r') as json_file:
+            return json.load(json_file)
+    except FileNotFoundError:
+        return dict()
+    except (OSError, json.JSONDecodeError) as error:
+        logger.warning(f'The label counts cache {file_path} could not be loaded. {type(error).__name__}: {error}')
+        return dict()
+
+
+def record_label_counts(num_of_labels_by_repo_link, file_path: Path = None):
+    """
+    Records the number of labels of the repositories in the cache.
+    :param num_of_labels_by_repo_link: The dictionary of the repository links to their number of labels
+    :param file_path: The json file path of the cache (default: cache/label_counts.json)
+    """
+
+    if not num_of_labels_by_repo_link:
+        return
+
+    file_path = file_path or LABEL_COUNTS_FILE_PATH
+    label_counts = load_label_counts(file_path)
+    retrieved_at = datetime.now().isoformat(timespec='seconds')
+    for repo_link, num_of_labels in num_of_labels_by_repo_link.items():
+        label_counts[repo_link] = {'num_of_labels': num_of_labels, 'retrieved_at': retrieved_at}
+    write_label_counts(label_counts, file_path)
+
+
+def forget_label_counts(repo_links, file_path: Path = None):
+    """
+    Removes the number of labels of the repositories from the cache, such as when the labels of a repository have
+    only been partially modified and the number of labels is no longer known.
+    :param repo_links: The list of repository links
+    :param file_path: The json file path of the cache (default: cache/label_counts.json)
+    """
+
+    file_path = file_path or LABEL_COUNTS_FILE_PATH
+    label_counts = load_label_counts(file_path)
+    if not any(repo_link in label_counts for repo_link in repo_links):
+        return
+    for repo_link in repo_links:
+        label_counts.pop(repo_link, None)
+    write_label_counts(label_counts, file_path)
+
+
+def write_label_counts(label_counts, file_path: Path):
+    """
+    Writes the label counts to the cache.
+    A cache which cannot be written does not fail the command as the cache is only used for estimates.
+    :param label_counts: The dictionary of the repository links to their number of labels and retrieval time
+    :param file_path: The json file path of the cache
+    """
+
+    try:
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(file_path, mode='w') as json_file:
+            json.dump(label_counts, json_file, indent=4)
+    except OSError as error:
+        logger.warning(f'The label counts cache {file_path} could not be written. {type(error).__name__}: {error}')
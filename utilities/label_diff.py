@@ -0,0 +1,58 @@
+"""
+This module contains the comparison of the labels of a repository against the desired labels.
+It is used by the importers to decide which labels to create, update and delete and by the audit subcommand
+to report the labels which have drifted from the template.
+"""
+
+from collections import namedtuple
+from utilities.label_normalization import LABEL_PROPERTIES, normalize_label
+
+
+class LabelDiff(namedtuple('LabelDiff', ['missing', 'extra', 'mismatched', 'unchanged'])):
+    """
+    The names of the labels which are missing from the repository, the extra labels in the repository which are
+    not desired, the labels whose properties do not match the desired properties and the labels which are identical.
+    The names are in lowercase which is the key of the labels dictionary compatible with this command line interface.
+    """
+
+    @property
+    def has_drift(self):
+        return bool(self.missing or self.extra or self.mismatched)
+
+
+def diff_labels(desired_labels, existing_labels):
+    """
+    Returns the differences between the desired labels and the existing labels of a repository.
+    :param desired_labels: The dictionary of desired labels such as the labels of the json file or template
+    :param existing_labels: The dictionary of existing labels of the repository
+    :return: Returns the LabelDiff of the existing labels against the desired labels.
+    """
+
+    missing, mismatched, unchanged = [], [], []
+    for current_label_name, current_properties in desired_labels.items():
+        if current_label_name not in existing_labels:
+            missing.append(current_label_name)
+        # Only the canonical properties are compared, hence equivalent labels are not updated.
+        elif diff_label_properties(current_properties, existing_labels[current_label_name]):
+            mismatched.append(current_label_name)
+        else:
+            unchanged.append(current_label_name)
+    extra = [current_label_name for current_label_name in existing_labels if current_label_name not in desired_labels]
+    return LabelDiff(missing, extra, mismatched, unchanged)
+
+
+def diff_label_properties(desired_properties, existing_properties):
+    """
+    Returns the properties of a label whose values differ.
+    The properties which the desired label does not have, such as a missing color, are not compared.
+    :param desired_properties: The desired properties of the label
+    :param existing_properties: The existing properties of the label
+    :return: Returns a dictionary of the property name with the desired and existing values.
+    """
+
+    desired_properties = normalize_label(desired_properties)
+    existing_properties = normalize_label(existing_properties)
+    return {property_name: (desired_properties[property_name], existing_properties.get(property_name))
+            for property_name in sorted(LABEL_PROPERTIES)
+            if property_name in desired_properties
+            and desired_properties[property_name] != existing_properties.get(property_name)}
@@ -0,0 +1,43 @@
+"""
+This module contains the canonical form of the labels compatible with this command line interface.
+The labels are normalised when they are extracted and when they are loaded for import so that equivalent labels,
+such as colors which only differ in case or a missing description, are not updated on every run.
+"""
+
+# The only properties of a label which are compared and written, the other properties are dropped.
+LABEL_PROPERTIES = ('name', 'color', 'description')
+# The color which GitHub API gives a label created without a color, other backends require a color.
+DEFAULT_LABEL_COLOR = 'ededed'
+
+
+def normalize_label(properties):
+    """
+    Returns the canonical properties of the label which are the name, the lowercase color without a leading #
+    and the description which is an empty string if the label does not have a description.
+    The color is left out if the label does not have a color, such as a hand-edited label, hence the color of the
+    existing label is kept.
+    :param properties: The properties of the label such as the label retrieved from the API or loaded from a json file
+    :return: Returns the canonical properties of the label.
+    """
+
+    label = {'name': properties['name']}
+    color = str(properties.get('color') or '').lstrip('#').lower()
+    if color:
+        label['color'] = color
+    label['description'] = properties.get('description') or ''
+    return label
+
+
+def normalize_labels(labels_dict):
+    """
+    Returns the dictionary of labels with canonical properties, keyed by the lowercase label name.
+    :param labels_dict: The dictionary of labels such as the labels loaded from a json file
+    :return: Returns the dictionary of labels with canonical properties.
+    """
+
+    normalized_labels = dict()
+    for current_label_name, current_properties in labels_dict.items():
+        # The name is taken from the key if a hand-edited label does not have a name.
+        current_label = normalize_label({'name': current_label_name, **current_properties})
+        normalized_labels[current_label['name'].lower()] = current_label
+    return normalized_labels
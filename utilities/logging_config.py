@@ -0,0 +1,150 @@
+"""
+This module contains the logging configuration of the command line interface.
+Log records are placed on a queue and written to the log file and the console by a background listener thread,
+hence no file or console I/O is performed on the event loop.
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import re
+import sys
+
+from datetime import datetime
+from pathlib import Path
+
+LOG_DIRECTORY = Path.cwd().joinpath('logs')
+# The number of default log files which are kept in the log directory, the older log files are removed.
+MAX_DEFAULT_LOG_FILES = 10
+TEXT_LOG_FORMAT = "%(asctime)s [%(levelname)s] %(message)s"
+DEBUG_TEXT_LOG_FORMAT = "%(asctime)s %(name)s %(funcName)s [%(levelname)s] %(message)s"
+LOG_FORMATS = ['text', 'json']
+
+# The attributes every log record has, anything else on a record has been passed through the extra parameter.
+STANDARD_LOG_RECORD_ATTRIBUTES = set(logging.LogRecord('', logging.NOTSET, '', 0, '', None, None).__dict__.keys()) \
+    | {'message', 'asctime'}
+
+_current_listener = None
+
+
+class LazyJson:
+    """
+    Wraps a payload which is only serialised to json when the log record is formatted.
+    As logging only formats records which pass the level check, debug payloads cost nothing
+    unless debug logging is enabled.
+    Example: logger.debug('Labels: %s', LazyJson(labels))
+    """
+
+    __slots__ = ('payload',)
+
+    def __init__(self, payload):
+        self.payload = payload
+
+    def __str__(self):
+        return json.dumps(self.payload)
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Formats each log record as a single json object per line including any fields passed through extra.
+    """
+
+    def format(self, record):
+        log_entry = {
+            'time': self.formatTime(record),
+            'level': record.levelname,
+            'logger': record.name,
+            'function': record.funcName,
+            'message': record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in STANDARD_LOG_RECORD_ATTRIBUTES:
+                log_entry[key] = value
+        if record.exc_info:
+            log_entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(log_entry, default=str)
+
+
+def default_log_file_path():
+    """
+    Returns the default log file path for the current run.
+    :return: Returns the log file path in the format 'logs/repolabels_{current date and time}.log'
+    """
+
+    return LOG_DIRECTORY.joinpath(f"repolabels_{re.sub(r'[-.: ]', '_', str(datetime.now()))}.log")
+
+
+def remove_old_log_files(log_directory: Path = None, max_log_files=MAX_DEFAULT_LOG_FILES):
+    """
+    Removes the oldest default log files so that at most max_log_files default log files remain.
+    Log files which are not named in the default format, such as those passed through --log-file, are kept.
+    :param log_directory: The directory of the default log files (default: logs)
+    :param max_log_files: The max number of default log files which are kept
+    """
+
+    log_directory = log_directory or LOG_DIRECTORY
+    # The default log file names contain the date and time of the run, hence they are sorted from oldest to newest.
+    log_file_paths = sorted(log_directory.glob('repolabels_*.log'))
+    for log_file_path in log_file_paths[:max(0, len(log_file_paths) - max_log_files)]:
+        try:
+            log_file_path.unlink()
+        except OSError:
+            pass
+
+
+def setup_logging(debug_mode=False, log_file_path: Path = None, log_format='text'):
+    """
+    Configures the root logger to hand off log records to a queue which is drained by a background listener
+    writing to the log file and to the console.
+    :param debug_mode: Logs debug level records with a more detailed format if True.
+    :param log_file_path: The log file path of the current run. Log records are appended to the file.
+    Defaults to a new log file for every run, of which only the last MAX_DEFAULT_LOG_FILES are kept.
+    :param log_format: The format of the log file records, either 'text' or 'json'.
+    :return: Returns the started QueueListener.
+    """
+
+    global _current_listener
+
+    stop_logging()
+
+    is_default_log_file_path = log_file_path is None
+    if is_default_log_file_path:
+        log_file_path = default_log_file_path()
+    log_file_path.parent.mkdir(parents=True, exist_ok=True)
+    if is_default_log_file_path:
+        # The log file of the current run is created afterwards, hence one fewer log file is kept.
+        remove_old_log_files(log_file_path.parent, MAX_DEFAULT_LOG_FILES - 1)
+
+    text_formatter = logging.Formatter(DEBUG_TEXT_LOG_FORMAT if debug_mode else TEXT_LOG_FORMAT)
+    file_handler = logging.FileHandler(log_file_path, mode='a', encoding='utf-8')
+    file_handler.setFormatter(JsonFormatter() if log_format == 'json' else text_formatter)
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(text_formatter)
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    # The queue handler only merges the message with its arguments, the listener handlers apply the actual format.
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    logging.basicConfig(level=logging.DEBUG if debug_mode else logging.INFO, handlers=[queue_handler], force=True)
+
+    _current_listener = logging.handlers.QueueListener(log_queue, file_handler, stream_handler)
+    _current_listener.start()
+    # The listener thread is a daemon thread, hence the queued log records are flushed before the interpreter exits.
+    atexit.register(stop_logging)
+    return _current_listener
+
+
+def stop_logging():
+    """
+    Stops the background listener after all queued log records have been written.
+    """
+
+    global _current_listener
+
+    if _current_listener:
+        _current_listener.stop()
+        for handler in _current_listener.handlers:
+            handler.close()
+        _current_listener = None
@@ -0,0 +1,97 @@
+"""
+This module contains the coalescing of identical read requests.
+Identical requests which are in flight at the same time are merged into a single network request whose result is
+shared with every caller. Optionally, the results are kept in an in-memory cache for a short time so that identical
+requests made later in the same run are served without any network request.
+"""
+
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class RequestCoalescer:
+
+    def __init__(self, cache_ttl=0):
+        # The number of seconds the results are cached for, 0 disables the cache.
+        self.cache_ttl = cache_ttl
+        self.in_flight_requests = dict()
+        self.cached_results = dict()
+        self.num_of_network_requests = 0
+        self.num_of_coalesced_requests = 0
+        self.num_of_cached_requests = 0
+
+    def get_cached_result(self, key):
+        """
+        Returns the cached expiry time and result of the request identified by the key.
+        :param key: The key which identifies identical requests
+        :return: Returns the tuple of the expiry time and result, None if the result is not cached or has expired.
+        """
+
+        cached_result = self.cached_results.get(key)
+        if cached_result is None:
+            return None
+        if time.monotonic() >= cached_result[0]:
+            del self.cached_results[key]
+            return None
+        return cached_result
+
+    def invalidate(self, key_prefix):
+        """
+        Removes the cached results whose key starts with the key prefix, such as after the labels have been modified.
+        :param key_prefix: The prefix of the keys to be removed
+        """
+
+        for key in [key for key in self.cached_results if key.startswith(key_prefix)]:
+            del self.cached_results[key]
+
+    async def request(self, key, request_func):
+        """
+        Returns the result of the request identified by the key. The request is only sent if there is no identical
+        request in flight and no cached result.
+        :param key: The key which identifies identical requests
+        :param request_func: The function which returns the request coroutine
+        :return: Returns the result of the request.
+        """
+
+        cached_result = self.get_cached_result(key)
+        if cached_result:
+            self.num_of_cached_requests += 1
+            logger.debug('Served %s from the cache', key)
+            return cached_result[1]
+
+        in_flight_request = self.in_flight_requests.get(key)
+        # The in flight requests of a previous event loop cannot be awaited, such as when the loop was interrupted.
+        if in_flight_request and in_flight_request.get_loop() is asyncio.get_running_loop():
+            self.num_of_coalesced_requests += 1
+            logger.debug('Coalesced %s with the request in flight', key)
+        else:
+            self.num_of_network_requests += 1
+            in_flight_request = asyncio.ensure_future(request_func())
+            self.in_flight_requests[key] = in_flight_request
+            in_flight_request.add_done_callback(lambda done_request: self.on_request_done(key, done_request))
+
+        # The shared request is shielded so that a cancelled caller does not cancel the request of the other callers.
+        return await asyncio.shield(in_flight_request)
+
+    def on_request_done(self, key, done_request):
+        if self.in_flight_requests.get(key) is done_request:
+            del self.in_flight_requests[key]
+        if self.cache_ttl > 0 and not done_request.cancelled() and done_request.exception() is None:
+            self.cached_results[key] = (time.monotonic() + self.cache_ttl, done_request.result())
+
+
+# The coalescer shared by every extractor of the current run.
+label_requests = RequestCoalescer()
+
+
+def configure_request_cache(cache_ttl):
+    """
+    Configures the number of seconds the results of the label requests are cached for, 0 disables the cache.
+    :param cache_ttl: The number of seconds the results are cached for
+    """
+
+    label_requests.cache_ttl = max(0, cache_ttl)
+    label_requests.cached_results.clear()
@@ -0,0 +1,190 @@
+"""
+This module contains the execution of the asynchronous operations of a command within the command deadline.
+The operations are tracked so that a partial report of the completed, failed and pending operations can be
+printed and written when the command is interrupted, exceeds its deadline or a request fails.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+
+from collections import namedtuple
+from pathlib import Path
+from exceptions.general_exceptions import DeadlineExceeded
+from utilities.constants import OperationStatus
+from utilities.http_traffic import close_shared_client_session
+
+# The exit codes when the command exceeds its deadline and when the command is interrupted such as by Ctrl-C
+DEADLINE_EXCEEDED_EXIT_CODE = 124
+INTERRUPTED_EXIT_CODE = 130
+
+logger = logging.getLogger(__name__)
+
+Operation = namedtuple('Operation', ['description', 'status', 'error'])
+
+
+def describe_error(error):
+    # The exceptions of this command line interface already start their message with their type name.
+    if hasattr(error, 'message'):
+        return error.message
+    return f'{type(error).__name__}: {error}' if str(error) else type(error).__name__
+
+
+class OperationTracker:
+
+    def __init__(self):
+        self.operations = []
+
+    def track(self, description, operation_func):
+        """
+        Registers the operation as pending and returns the coroutine which runs the operation and records
+        whether it has completed or failed. The operation remains pending if it is cancelled.
+        :param description: The description of the operation such as Create label bug in {repo link}
+        :param operation_func: The function which returns the operation coroutine
+        :return: Returns the coroutine which runs the operation.
+        """
+
+        operation_index = len(self.operations)
+        self.operations.append(Operation(description, OperationStatus.PENDING, None))
+        return self.run_operation(operation_index, operation_func)
+
+    async def run_operation(self, operation_index, operation_func):
+        description = self.operations[operation_index].description
+        try:
+            result = await operation_func()
+        except Exception as error:
+            self.operations[operation_index] = Operation(description, OperationStatus.FAILED, describe_error(error))
+            raise
+        self.operations[operation_index] = Operation(description, OperationStatus.COMPLETED, None)
+        return result
+
+    def operations_by_status(self, status: OperationStatus):
+        return [operation for operation in self.operations if operation.status == status]
+
+    def gen_report(self, reason):
+        return {
+            'reason': reason,
+            **{status.value.lower(): [{'operation': operation.description, 'error': operation.error}
+                                      if operation.error else {'operation': operation.description}
+                                      for operation in self.operations_by_status(status)]
+               for status in OperationStatus},
+        }
+
+
+# The operations of the current run
+operation_tracker = OperationTracker()
+
+_deadline = None
+_deadline_seconds = None
+_partial_report_file_path = None
+
+
+def configure_run_control(deadline_seconds=None, partial_report_file_path: Path = None):
+    """
+    Configures the deadline of the current command and the file path which the partial report is written to.
+    :param deadline_seconds: The number of seconds from now which the command has to complete within,
+    None if the command does not have a deadline.
+    :param partial_report_file_path: The json file path which the partial report is written to,
+    None if the partial report is only logged.
+    """
+
+    global _deadline, _deadline_seconds, _partial_report_file_path
+
+    _deadline_seconds = deadline_seconds if deadline_seconds and deadline_seconds > 0 else None
+    _deadline = time.monotonic() + _deadline_seconds if _deadline_seconds else None
+    _partial_report_file_path = partial_report_file_path
+
+
+async def run_within_deadline(coroutine):
+    if _deadline is None:
+        return await coroutine
+
+    remaining_seconds = _deadline - time.monotonic()
+    if remaining_seconds <= 0:
+        coroutine.close()
+        raise DeadlineExceeded(_deadline_seconds)
+    try:
+        return await asyncio.wait_for(coroutine, remaining_seconds)
+    except asyncio.TimeoutError:
+        # A timeout of a single request is only a deadline exceeded if the deadline has passed.
+        if time.monotonic() >= _deadline:
+            raise DeadlineExceeded(_deadline_seconds)
+        raise
+
+
+async def run_and_close_shared_session(coroutine):
+    try:
+        return await run_within_deadline(coroutine)
+    finally:
+        # The shared session is closed before the event loop, even if the command failed or was interrupted.
+        await close_shared_client_session()
+
+
+def report_partial_operations(reason):
+    """
+    Logs the completed, failed and pending operations of the current run and writes them to the partial report
+    file path if it is configured.
+    :param reason: The reason the command did not complete
+    """
+
+    # The reason is the only report if no operation was tracked, such as when watching the rate limits.
+    if not operation_tracker.operations:
+        logger.error(reason)
+        return
+
+    completed = operation_tracker.operations_by_status(OperationStatus.COMPLETED)
+    failed = operation_tracker.operations_by_status(OperationStatus.FAILED)
+    pending = operation_tracker.operations_by_status(OperationStatus.PENDING)
+    response = f'{reason}\nPartial report: {len(completed)} completed, {len(failed)} failed ' \
+               f'and {len(pending)} pending operations.'
+    for header, operations in [('Completed', completed), ('Failed', failed), ('Pending', pending)]:
+        if operations:
+            response = f'{response}\n{header} operations:'
+        for operation in operations:
+            response = f'{response}\n    {operation.description}' + (f' ({operation.error})' if operation.error else '')
+    logger.error(response)
+
+    if _partial_report_file_path:
+        _partial_report_file_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(_partial_report_file_path, mode='w') as json_file:
+            json.dump(operation_tracker.gen_report(reason), json_file, indent=4)
+        logger.info(f'The partial report has been written to {_partial_report_file_path}')
+
+
+def run_async(coroutine, handle_interrupt=True):
+    """
+    Runs the coroutine in a new event loop within the deadline of the command.
+    If the command is interrupted, exceeds its deadline or a tracked operation fails, the in-flight operations are
+    cancelled, the partial report is logged and the program exits.
+    :param coroutine: The coroutine to be run
+    :param handle_interrupt: Raises the KeyboardInterrupt to the caller instead of exiting if False,
+    such as when interrupting is the usual way to stop the command
+    :return: Returns the result of the coroutine.
+    """
+
+    # Workaround for known issue involving event loop for Windows environment:
+    # Resources:
+    # https://github.com/aio-libs/aiohttp/issues/4536#issuecomment-698441077
+    # https://bugs.python.org/issue39232 (Known issue in Python)
+    if os.name == "nt":
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+
+    num_of_failed_operations = len(operation_tracker.operations_by_status(OperationStatus.FAILED))
+    try:
+        # asyncio.run cancels the tasks which are still in flight before it returns or raises.
+        return asyncio.run(run_and_close_shared_session(coroutine))
+    except KeyboardInterrupt:
+        if not handle_interrupt:
+            raise
+        report_partial_operations('The command was interrupted.')
+        raise SystemExit(INTERRUPTED_EXIT_CODE)
+    except DeadlineExceeded as error:
+        report_partial_operations(error.message)
+        raise SystemExit(DEADLINE_EXCEEDED_EXIT_CODE)
+    except Exception as error:
+        if len(operation_tracker.operations_by_status(OperationStatus.FAILED)) == num_of_failed_operations:
+            raise
+        report_partial_operations(f'The command failed. {describe_error(error)}')
+        raise SystemExit(1)